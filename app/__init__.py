@@ -10,10 +10,14 @@ from dotenv import load_dotenv
 
 from app.lib.jinja import apply_jinja_env
 from app.lib.cache import Cache
+from app.lib.limiter import RenderLimiter
+from app.lib.convert_pool import ConvertPool
 
 
 db = SQLAlchemy()
 cache = Cache()
+render_limiter = RenderLimiter()
+convert_pool = ConvertPool()
 login_manager = LoginManager()
 
 
@@ -26,6 +30,36 @@ def create_app():
     app.config.from_prefixed_env(prefix='FRUITSTAND')
     app.config['CACHE_DRIVER'] = app.config.get('CACHE_DRIVER', 'filesystem')
     app.config['BROWSER'] = app.config.get('BROWSER', 'chrome')
+    app.config['RENDER_SOCKET'] = app.config.get('RENDER_SOCKET')
+    app.config['RENDER_POOL_SIZE'] = int(app.config.get('RENDER_POOL_SIZE', 2))
+    app.config['RENDER_RECYCLE_AFTER'] = int(app.config.get('RENDER_RECYCLE_AFTER', 100))
+    app.config['RENDER_WARM_PAGES'] = int(app.config.get('RENDER_WARM_PAGES', 4))
+    app.config['RENDER_SERVICE_QUEUE_SIZE'] = int(app.config.get('RENDER_SERVICE_QUEUE_SIZE', 20))
+    app.config['RENDER_TIMEOUT'] = int(app.config.get('RENDER_TIMEOUT', 60))
+    app.config['RENDER_READY_TIMEOUT'] = int(app.config.get('RENDER_READY_TIMEOUT', 10))
+    app.config['RENDER_DEADLINE'] = int(app.config.get('RENDER_DEADLINE', 30))
+    app.config['RENDER_CONCURRENCY'] = int(app.config.get('RENDER_CONCURRENCY', 2))
+    app.config['RENDER_QUEUE_SIZE'] = int(app.config.get('RENDER_QUEUE_SIZE', 10))
+    app.config['RENDER_QUEUE_TIMEOUT'] = int(app.config.get('RENDER_QUEUE_TIMEOUT', 30))
+    app.config['RENDER_RETRY_AFTER'] = int(app.config.get('RENDER_RETRY_AFTER', 60))
+    app.config['RENDER_TIMING_LOG'] = bool(app.config.get('RENDER_TIMING_LOG', False))
+    app.config['FRAME_CACHE_EXPIRY'] = int(app.config.get('FRAME_CACHE_EXPIRY', 3600))
+    app.config['CONVERT_CACHE_EXPIRY'] = int(app.config.get('CONVERT_CACHE_EXPIRY', 3600))
+    app.config['CONVERT_WORKERS'] = int(app.config.get('CONVERT_WORKERS', 0))
+    app.config['CONVERT_SHM_MIN_SIZE'] = int(app.config.get('CONVERT_SHM_MIN_SIZE', 1024 * 1024))
+    app.config['CONVERT_BAND_HEIGHT'] = int(app.config.get('CONVERT_BAND_HEIGHT', 0))
+    app.config['LAST_FRAME_EXPIRY'] = int(app.config.get('LAST_FRAME_EXPIRY', 7 * 86400))
+    app.config['FRAME_ACCEL_DIR'] = app.config.get('FRAME_ACCEL_DIR')
+    app.config['FRAME_ACCEL_PREFIX'] = app.config.get('FRAME_ACCEL_PREFIX', '/_frames/')
+    app.config['FRAME_ACCEL_MAX_AGE'] = int(app.config.get('FRAME_ACCEL_MAX_AGE', 3600))
+    app.config['DELTA_MAX_RATIO'] = float(app.config.get('DELTA_MAX_RATIO', 0.5))
+    app.config['DELTA_BAND_HEIGHT'] = int(app.config.get('DELTA_BAND_HEIGHT', 16))
+    app.config['RENDER_ASYNC_TIMEOUT'] = int(app.config.get('RENDER_ASYNC_TIMEOUT', 60))
+    app.config['PRERENDER_INTERVAL'] = float(app.config.get('PRERENDER_INTERVAL', 5))
+    app.config['PRERENDER_LEAD'] = int(app.config.get('PRERENDER_LEAD', 60))
+    app.config['PRERENDER_GRACE'] = int(app.config.get('PRERENDER_GRACE', 300))
+    app.config['PRERENDER_MAX_AGE'] = int(app.config.get('PRERENDER_MAX_AGE', 300))
+    app.config['PRERENDER_ARGS_EXPIRY'] = int(app.config.get('PRERENDER_ARGS_EXPIRY', 7 * 86400))
     app.config['SCREEN_IMPORTS'] = list(filter(None, map(str.strip, (app.config.get('SCREEN_IMPORTS') or '').split(','))))
     app.config['SCREEN_IMPORTS'] += [
         'app.screens.zen_quotes',
@@ -45,6 +79,8 @@ def create_app():
     db.init_app(app)
     Migrate(app, db)
     cache.init_app(app)
+    render_limiter.init_app(app)
+    convert_pool.init_app(app)
     login_manager.init_app(app)
     login_manager.login_view = "user.login"
 
@@ -75,11 +111,13 @@ def create_app():
 
     from app.commands import (
         compile_assets as compile_assets_commands,
+        render as render_commands,
         user as user_commands,
         util as util_commands,
     )
 
     app.cli.add_command(compile_assets_commands.cli)
+    app.cli.add_command(render_commands.cli)
     app.cli.add_command(user_commands.cli)
     app.cli.add_command(util_commands.cli)
 
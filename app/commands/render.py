@@ -0,0 +1,85 @@
+import os
+import sys
+import time
+import json
+
+import click
+from flask import current_app
+from flask.cli import FlaskGroup
+
+from app import db, render_limiter
+from app.lib.prerender import get_due_displays, prerender_displays
+from app.lib.accel import prune_frame_files
+
+
+@click.group('render', cls=FlaskGroup)
+def cli():
+    pass
+
+
+@cli.command('serve')
+@click.option('-s', '--socket', help="Unix socket path or host:port to listen on, defaults to FRUITSTAND_RENDER_SOCKET")
+@click.option('-n', '--pool-size', type=int, help="Number of browser instances to keep running, defaults to FRUITSTAND_RENDER_POOL_SIZE")
+@click.option('-r', '--recycle-after', type=int, help="Restart each browser after this many renders, defaults to FRUITSTAND_RENDER_RECYCLE_AFTER")
+@click.option('-w', '--warm-pages', type=int, help="Number of pages each browser keeps loaded for reuse, defaults to FRUITSTAND_RENDER_WARM_PAGES")
+@click.option('-q', '--queue-size', type=int, help="Number of jobs that can wait for a browser, defaults to FRUITSTAND_RENDER_SERVICE_QUEUE_SIZE")
+def serve(socket, pool_size, recycle_after, warm_pages, queue_size):
+    socket = socket or current_app.config.get('RENDER_SOCKET')
+    if not socket:
+        sys.stderr.write("[E] No socket given and FRUITSTAND_RENDER_SOCKET is not set\n")
+        sys.exit(1)
+
+    command = [
+        'node', os.path.join(os.path.dirname(current_app.root_path), 'render-server.js'),
+        '--socket', socket,
+        '--browser', current_app.config['BROWSER'],
+        '--pool-size', str(pool_size or current_app.config['RENDER_POOL_SIZE']),
+        '--recycle-after', str(recycle_after or current_app.config['RENDER_RECYCLE_AFTER']),
+        '--warm-pages', str(warm_pages if warm_pages is not None else current_app.config['RENDER_WARM_PAGES']),
+        '--queue-size', str(queue_size if queue_size is not None else current_app.config['RENDER_SERVICE_QUEUE_SIZE']),
+    ]
+    # Replace this process (rather than going through npm) so signals from a
+    # supervisor like uWSGI or docker reach the service directly
+    os.execvp(command[0], command)
+
+
+@cli.command('schedule')
+@click.option('-l', '--lead', type=int, help="Render frames for displays expected to poll within this many seconds, defaults to FRUITSTAND_PRERENDER_LEAD")
+@click.option('-i', '--interval', type=float, help="Seconds between checks for displays that are due, defaults to FRUITSTAND_PRERENDER_INTERVAL")
+@click.option('--once', is_flag=True, help="Check once and exit instead of running continuously")
+def schedule(lead, interval, once):
+    lead = lead or current_app.config['PRERENDER_LEAD']
+    interval = interval or current_app.config['PRERENDER_INTERVAL']
+    while True:
+        rendered, failed = prerender_displays(get_due_displays(lead, current_app.config['PRERENDER_GRACE']))
+        for display in rendered:
+            sys.stderr.write(f"[I] Prerendered next frame for display {display.id} ({display.name})\n")
+        for display, e in failed:
+            sys.stderr.write(f"[E] Failed to prerender display {display.id} ({display.name}), got {e.__class__.__name__}: {e}\n")
+        if failed:
+            db.session.rollback()
+        # Don't hold on to stale display state between checks
+        db.session.remove()
+
+        if once:
+            break
+        time.sleep(interval)
+
+
+@cli.command('stats')
+@click.option('--reset', is_flag=True, help="Reset the render totals after printing them")
+def stats(reset):
+    click.echo(json.dumps(render_limiter.get_stats(), indent=4))
+    if reset:
+        render_limiter.reset_stats()
+
+
+@cli.command('prune-frames')
+@click.option('-a', '--max-age', type=int, help="Delete frame files that haven't been sent for this many seconds, defaults to FRUITSTAND_FRAME_ACCEL_MAX_AGE")
+def prune_frames(max_age):
+    if not current_app.config['FRAME_ACCEL_DIR']:
+        sys.stderr.write("[E] FRUITSTAND_FRAME_ACCEL_DIR is not set\n")
+        sys.exit(1)
+
+    deleted, kept = prune_frame_files(max_age or current_app.config['FRAME_ACCEL_MAX_AGE'])
+    sys.stderr.write(f"[I] Deleted {deleted} frame file(s), kept {kept}\n")
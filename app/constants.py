@@ -54,6 +54,64 @@ COLOR_SPEC = {
     },
 }
 
+IMAGE_FORMAT = {
+    'BMP': {
+        'key': 'BMP',
+        'name': 'BMP',
+        'mimetype': 'image/bmp',
+        'lossy': False,
+    },
+    'JPEG': {
+        'key': 'JPEG',
+        'name': 'JPEG',
+        'mimetype': 'image/jpeg',
+        'lossy': True,
+    },
+    'PNG': {
+        'key': 'PNG',
+        'name': 'PNG',
+        'mimetype': 'image/png',
+        'lossy': False,
+    },
+    # Raw formats are the pixel data as the display would use it, after a
+    # small header; see app.lib.image.encode_raw
+    'RAW1': {
+        'key': 'RAW1',
+        'name': 'Raw 1 bit (monochrome)',
+        'mimetype': 'application/x-fruitstand-raw',
+        'lossy': False,
+        'bits': 1,
+    },
+    'RAW2': {
+        'key': 'RAW2',
+        'name': 'Raw 2 bit (palette)',
+        'mimetype': 'application/x-fruitstand-raw',
+        'lossy': False,
+        'bits': 2,
+    },
+    'RAW4': {
+        'key': 'RAW4',
+        'name': 'Raw 4 bit (palette)',
+        'mimetype': 'application/x-fruitstand-raw',
+        'lossy': False,
+        'bits': 4,
+    },
+    'RGB565': {
+        'key': 'RGB565',
+        'name': 'Raw RGB565',
+        'mimetype': 'application/x-fruitstand-raw',
+        'lossy': False,
+        'bits': 16,
+    },
+}
+
+# How colors missing from a display's palette are approximated
+DITHER = {
+    'floydsteinberg': 'Floyd-Steinberg',
+    'none': 'None (nearest color)',
+    'ordered': 'Ordered (Bayer pattern)',
+}
+
 DISP_STATUS = {
     'pending': 'Pending Approval',
     'active': 'Active',
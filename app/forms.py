@@ -9,7 +9,7 @@ import flask_login
 import pytz
 
 from app.models import Playlist, User, Display
-from app.constants import DISP_STATUS, SECRET_STATUS
+from app.constants import IMAGE_FORMAT, DITHER, DISP_STATUS, SECRET_STATUS
 
 
 class PlaylistEditForm(FlaskForm):
@@ -24,8 +24,10 @@ def DisplayEditForm(obj=None, **kwargs):
         name = StringField('Display Name', validators=[DataRequired()])
         if current_app.config['ENABLE_DISPLAY_APPROVAL']:
             form_status = SelectField("Status", choices=[(k, v) for k, v in DISP_STATUS.items()], validators=[DataRequired()])
-        image_format = SelectField("Image Format", choices=[('BMP', 'BMP'), ('JPEG', 'JPEG'), ('PNG', 'PNG')], validators=[DataRequired()])
+        # Only formats that can hold the display's colors
+        image_format = SelectField("Image Format", choices=[(k, v['name']) for k, v in IMAGE_FORMAT.items() if not obj or Display.image_format_fits(k, obj.color_spec.code)], validators=[DataRequired()])
         image_bit_depth = SelectField("Image Bit Depth", choices=[(None, 'Default'), (1, '1 bit (monochrome)'), (16, '16 bit'), (24, '24 bit')], validators=[Optional()])
+        dither = SelectField("Dithering", choices=[(k, v) for k, v in DITHER.items()], validators=[DataRequired()], description="For color displays with a limited palette, or monochrome with ordered dithering; Floyd-Steinberg looks best, while ordered and no dithering are faster and only change what changed on the screen")
         playlist = QuerySelectField('Playlist',
             validators=[Optional()],
             query_factory=lambda: Playlist.query.order_by(Playlist.name.asc()),
@@ -36,6 +38,10 @@ def DisplayEditForm(obj=None, **kwargs):
         )
         submit = SubmitField("Save Display")
 
+        def validate_image_format(self, field):
+            if obj and field.data in IMAGE_FORMAT and not Display.image_format_fits(field.data, obj.color_spec.code, self.image_bit_depth.data):
+                raise ValidationError(f"{IMAGE_FORMAT[field.data]['name']} can't hold this display's colors at this bit depth")
+
         def populate_obj(self, obj):
             old_status = obj.status
             super().populate_obj(obj)
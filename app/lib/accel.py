@@ -0,0 +1,59 @@
+from typing import Tuple
+import os
+import time
+import hashlib
+import tempfile
+
+from flask import current_app
+
+
+def write_frame_file(payload: bytes) -> str:
+    """\
+    Write a frame's payload to the frame directory, named by its content so
+    identical frames share a file, and return the internal URL nginx serves
+    it from
+    """
+
+    digest = hashlib.sha256(payload).hexdigest()
+    name = f'{digest[:2]}/{digest}'
+    path = os.path.join(current_app.config['FRAME_ACCEL_DIR'], name)
+    try:
+        # Keep it from being pruned while it's in use
+        os.utime(path)
+    except FileNotFoundError:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        # Write under a temporary name so nginx never sees a partial file
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), prefix='.')
+        try:
+            with os.fdopen(fd, 'wb') as fp:
+                fp.write(payload)
+            # mkstemp only allows the owner to read, nginx likely runs as another user
+            os.chmod(tmp_path, 0o644)
+            os.replace(tmp_path, path)
+        except:
+            os.unlink(tmp_path)
+            raise
+    return current_app.config['FRAME_ACCEL_PREFIX'].rstrip('/') + '/' + name
+
+
+def prune_frame_files(max_age: int) -> Tuple[int, int]:
+    """\
+    Delete frame files that haven't been sent for max_age seconds, returning
+    the number of files deleted and kept
+    """
+
+    deleted = kept = 0
+    expires = time.time() - max_age
+    for dirpath, dirnames, filenames in os.walk(current_app.config['FRAME_ACCEL_DIR']):
+        for filename in filenames:
+            path = os.path.join(dirpath, filename)
+            try:
+                if os.stat(path).st_mtime < expires:
+                    os.unlink(path)
+                    deleted += 1
+                else:
+                    kept += 1
+            except FileNotFoundError:
+                # Pruned by something else at the same time
+                pass
+    return deleted, kept
@@ -89,11 +89,11 @@ class FilesystemDriver(CacheDriver):
             raise RuntimeError("Filesystem cache dir does not exist or is not a directory: " + self.cache_dir)
 
     def _get_path(self, key: str) -> str:
-        return os.path.join(self.cache_dir, hashlib.new('sha256', key).hexdigest())
+        return os.path.join(self.cache_dir, hashlib.new('sha256', key.encode('utf-8')).hexdigest())
 
     def _load_key(self, key: str) -> Optional[Any]:
         filename = self._get_path(key)
-        if os.is_file(filename):
+        if os.path.isfile(filename):
             try:
                 with open(filename, 'rb') as fp:
                     res = pickle.load(fp)
@@ -102,7 +102,11 @@ class FilesystemDriver(CacheDriver):
             except:
                 pass
 
-            os.unlink(filename)
+            try:
+                os.unlink(filename)
+            except FileNotFoundError:
+                # Another process got there first
+                pass
 
     def get(self, key: str) -> Optional[Any]:
         res = self._load_key(key)
@@ -111,18 +115,26 @@ class FilesystemDriver(CacheDriver):
 
     def set(self, key: str, expiry: int, data: Any) -> bool:
         filename = self._get_path(key)
-        with open(filename, 'wb') as fp:
-            obj = {'expires': str(arrow.utcnow().shift(seconds=expiry)), 'data': data}
-            pickle.dump(obj, fp)
-            return True
-        return False
+        obj = {'expires': str(arrow.utcnow().shift(seconds=expiry)), 'data': data}
+        # Write to a temporary file and move it into place, so other processes
+        # never read a partly written one
+        fd, tmp_filename = tempfile.mkstemp(dir=self.cache_dir, prefix='.tmp-')
+        try:
+            with os.fdopen(fd, 'wb') as fp:
+                pickle.dump(obj, fp)
+            os.replace(tmp_filename, filename)
+        except:
+            os.unlink(tmp_filename)
+            raise
+        return True
 
     def delete(self, key: str) -> bool:
         filename = self._get_path(key)
-        if os.is_file(filename):
+        try:
             os.unlink(filename)
             return True
-        return False
+        except FileNotFoundError:
+            return False
 
 
 class DatabaseDriver(CacheDriver):
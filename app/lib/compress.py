@@ -0,0 +1,45 @@
+import re
+
+
+# Runs of 3 or more of the same byte
+RUN_RE = re.compile(rb'(.)\1{2,}', re.DOTALL)
+
+
+def _pack_literal(out: bytearray, data: bytes):
+    for i in range(0, len(data), 128):
+        chunk = data[i:i + 128]
+        out.append(len(chunk) - 1)
+        out += chunk
+
+
+def _pack_run(out: bytearray, byte: int, length: int):
+    while length >= 2:
+        n = min(length, 128)
+        out.append(257 - n)
+        out.append(byte)
+        length -= n
+    if length:
+        _pack_literal(out, bytes([byte]))
+
+
+def packbits(data: bytes) -> bytes:
+    """\
+    Run length encode data in the PackBits format, which is simple enough for
+    microcontrollers to decode as it is received.  The data is a sequence of
+    a header byte n followed by:
+
+    * 0 to 127: n + 1 literal bytes
+    * 129 to 255: one byte, to be repeated 257 - n times
+    * 128 is not used
+    """
+
+    out = bytearray()
+    pos = 0
+    for m in RUN_RE.finditer(data):
+        if m.start() > pos:
+            _pack_literal(out, data[pos:m.start()])
+        _pack_run(out, data[m.start()], m.end() - m.start())
+        pos = m.end()
+    if pos < len(data):
+        _pack_literal(out, data[pos:])
+    return bytes(out)
@@ -0,0 +1,190 @@
+from typing import Optional, Union, NamedTuple, Tuple
+import os
+import sys
+import shutil
+import multiprocessing
+from multiprocessing.shared_memory import SharedMemory
+from concurrent.futures import ProcessPoolExecutor, Future, TimeoutError
+from concurrent.futures.process import BrokenProcessPool
+
+from flask import Flask
+
+from app.lib.image import convert_colors, encode_image
+from app.lib.timing import reset_peak_rss, get_peak_rss, record_peak_rss
+
+
+class SharedBuffer(NamedTuple):
+    """A buffer passed between processes in shared memory, by its name"""
+    name: str
+    size: int
+
+
+def share_buffer(data: bytes, min_size: int) -> Union[bytes, SharedBuffer]:
+    """\
+    Copy data to shared memory if it's at least min_size bytes, otherwise it's
+    small enough to be pickled to the other process as it is.  Whoever reads
+    a shared buffer frees it.
+    """
+
+    if not min_size or len(data) < min_size:
+        return data
+    shm = SharedMemory(create=True, size=len(data))
+    try:
+        shm.buf[:len(data)] = data
+    except:
+        shm.unlink()
+        raise
+    finally:
+        shm.close()
+    return SharedBuffer(shm.name, len(data))
+
+
+def read_buffer(buf: Union[bytes, SharedBuffer]) -> bytes:
+    if not isinstance(buf, SharedBuffer):
+        return buf
+    shm = SharedMemory(name=buf.name)
+    try:
+        return bytes(shm.buf[:buf.size])
+    finally:
+        shm.close()
+        shm.unlink()
+
+
+def free_result(future: Future):
+    """Free the shared memory of a conversion that was given up on"""
+    if not future.cancelled() and future.exception() is None:
+        read_buffer(future.result()[0])
+
+
+def convert_in_worker(data: Union[bytes, SharedBuffer], bit_depth: Optional[int], color_spec: str, dither: str, fmt: str, band_height: int, shm_min_size: int) -> Tuple[Union[bytes, SharedBuffer], float]:
+    """\
+    Convert and encode a screenshot, in a pool worker, returning the frame and
+    the worker's peak memory while converting it
+    """
+
+    reset_peak_rss()
+    im = convert_colors(bit_depth, color_spec, read_buffer(data), dither, band_height)
+    return share_buffer(encode_image(im, fmt), shm_min_size), get_peak_rss()
+
+
+def get_python_executable() -> str:
+    """\
+    The Python interpreter to start pool workers with.  Under uWSGI
+    sys.executable is the uwsgi binary (unless it's run with
+    --py-sys-executable), so look for the interpreter it embeds instead.
+    """
+
+    if sys.executable and os.path.basename(sys.executable).startswith('python'):
+        return sys.executable
+    names = ['python%d.%d' % sys.version_info[:2], 'python3']
+    for name in names:
+        path = os.path.join(sys.exec_prefix, 'bin', name)
+        if os.access(path, os.X_OK):
+            return path
+    for name in names:
+        path = shutil.which(name)
+        if path:
+            return path
+    raise RuntimeError("Can't find a Python interpreter to start conversion workers with, running as " + sys.executable)
+
+
+def get_app_processes() -> int:
+    """The number of app processes, when running under uWSGI"""
+    try:
+        import uwsgi
+    except ImportError:
+        return 1
+    return max(1, uwsgi.numproc)
+
+
+class ConvertPool:
+    """\
+    Converts screenshots for displays in a pool of worker processes, so the
+    conversion doesn't hold the GIL of the app process and screenshots for
+    several displays are converted on as many cores.  Large screenshots and
+    frames go through shared memory rather than being pickled through a pipe.
+
+    Each app process has its own pool; the configured number of workers is
+    shared out between uWSGI's processes, at least one each.
+    """
+
+    def __init__(self, app: Optional[Flask]=None):
+        self.total_workers = 0
+        self.executor = None
+        self.pid = None
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app: Flask):
+        self.total_workers = min(app.config['CONVERT_WORKERS'], os.cpu_count() or 1)
+        self.shm_min_size = app.config['CONVERT_SHM_MIN_SIZE']
+
+    @property
+    def workers(self) -> int:
+        """Workers in this process's pool"""
+        if not self.total_workers:
+            return 0
+        return max(1, self.total_workers // get_app_processes())
+
+    @property
+    def enabled(self) -> bool:
+        return self.total_workers > 0
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        # uWSGI forks its workers after the app is created, so each process
+        # starts its own pool when it first needs it; workers are spawned
+        # rather than forked from a process with threads and open sockets
+        if self.executor is None or self.pid != os.getpid():
+            context = multiprocessing.get_context('spawn')
+            context.set_executable(get_python_executable())
+            self.executor = ProcessPoolExecutor(self.workers, mp_context=context)
+            self.pid = os.getpid()
+        return self.executor
+
+    def _discard(self, executor: Optional[ProcessPoolExecutor]):
+        """Shut down a broken pool, so the next conversion starts a new one"""
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+        if self.executor is executor:
+            self.executor = None
+
+    def convert(self, data: bytes, bit_depth: Optional[int], color_spec: str, dither: str, fmt: str, band_height: int=0, timeout: Optional[float]=None) -> bytes:
+        """\
+        Convert a screenshot (PNG data) for a display and encode it in the
+        display's image format.  Raises concurrent.futures.TimeoutError if it
+        takes longer than timeout, or BrokenProcessPool if the pool's workers
+        died or couldn't be started.
+        """
+
+        shared = share_buffer(data, self.shm_min_size)
+        try:
+            executor = None
+            try:
+                executor = self._get_executor()
+                # Workers are started as they're needed, on submit
+                future = executor.submit(convert_in_worker, shared, bit_depth, color_spec, dither, fmt, band_height, self.shm_min_size)
+            except BrokenProcessPool:
+                self._discard(executor)
+                raise
+            except (RuntimeError, OSError) as e:
+                self._discard(executor)
+                raise BrokenProcessPool(f"Can't start conversion workers: {e}") from e
+
+            try:
+                result, peak_rss = future.result(timeout=timeout)
+                record_peak_rss('convert', peak_rss)
+                return read_buffer(result)
+            except TimeoutError:
+                if not future.cancel():
+                    future.add_done_callback(free_result)
+                raise
+            except BrokenProcessPool:
+                # A worker died, start a new pool for the next conversion
+                self._discard(executor)
+                raise
+        finally:
+            if isinstance(shared, SharedBuffer):
+                try:
+                    SharedMemory(name=shared.name).unlink()
+                except FileNotFoundError:
+                    pass
@@ -1,8 +1,13 @@
-from typing import List, Tuple, Optional
+from typing import List, Tuple, Optional, Union
+from io import BytesIO
+import struct
+import functools
 
-from PIL import Image
+from PIL import Image, ImageChops
+import numpy as np
 
-from app.constants import COLOR_SPEC
+from app.constants import COLOR_SPEC, IMAGE_FORMAT
+from app.lib.timing import timed
 
 
 def convert_palette(palette: List[int]) -> List[int]:
@@ -19,12 +24,131 @@ def convert_palette(palette: List[int]) -> List[int]:
     return out
 
 
-def convert_colors__cs(color_spec: str, in_im):
+def threshold_1bit(in_im, threshold: Union[int, np.ndarray]=170):
+    """\
+    Convert an image to 1 bit, white where its luminance is at least the
+    threshold.  The same as converting to L, thresholding with point() and
+    pasting into a 1 bit image, without the intermediate images.  The
+    threshold may also be a pattern of thresholds for ordered dithering, see
+    get_ordered_thresholds.
+    """
+
+    if in_im.mode == '1':
+        return in_im
+    # Pillow's own conversion is the fastest way to the luminance, and keeps
+    # the result identical; thresholding and packing the bits is vectorized
+    lum = np.asarray(in_im.convert('L'))
+    if isinstance(threshold, np.ndarray):
+        mask = apply_bayer_rows(np.greater_equal, lum, threshold, np.empty(lum.shape, dtype=bool))
+    else:
+        mask = lum >= threshold
+    return Image.frombytes('1', in_im.size, np.packbits(mask, axis=1).tobytes())
+
+
+DITHER_METHODS = {
+    'floydsteinberg': Image.Dither.FLOYDSTEINBERG,
+    'none': Image.Dither.NONE,
+    # The pattern is added before quantizing, see get_ordered_offsets
+    'ordered': Image.Dither.NONE,
+}
+
+BAYER_SIZE = 8
+
+
+@functools.lru_cache()
+def get_bayer_matrix(size: int=BAYER_SIZE):
+    """\
+    A size x size Bayer matrix (size being a power of 2), scaled to fractions
+    between 0 and 1 that are centered in each step
+    """
+
+    m = np.zeros((1, 1), dtype=np.int32)
+    while m.shape[0] < size:
+        m = np.block([[4 * m, 4 * m + 2], [4 * m + 3, 4 * m + 1]])
+    return (m + 0.5) / m.size
+
+
+def tile_bayer_matrix(width: int):
+    """The Bayer matrix repeated across an image's width, one matrix high"""
+    m = get_bayer_matrix()
+    return np.tile(m, (1, -(-width // m.shape[1])))[:, :width]
+
+
+def apply_bayer_rows(func, pixels: np.ndarray, rows: np.ndarray, out: np.ndarray) -> np.ndarray:
+    """\
+    Call a numpy function with pixels and rows of the Bayer pattern (see
+    tile_bayer_matrix), repeated down the image.  The image is viewed as a
+    stack of pattern high blocks rather than the pattern being repeated to
+    the image's full size, which takes as long and would need as much
+    memory as the image.
+    """
+
+    height = pixels.shape[0]
+    whole = height - height % BAYER_SIZE
+    blocks = lambda a: a[:whole].reshape(-1, BAYER_SIZE, *a.shape[1:])
+    func(blocks(pixels), rows, out=blocks(out))
+    func(pixels[whole:], rows[:height - whole], out=out[whole:])
+    return out
+
+
+@functools.lru_cache(maxsize=16)
+def get_ordered_thresholds(width: int):
+    """Luminance thresholds for ordered dithering to 1 bit, one pattern high"""
+    return (tile_bayer_matrix(width) * 255).round().astype(np.uint8)
+
+
+@functools.lru_cache(maxsize=16)
+def get_ordered_offsets(width: int, spread: int):
+    """\
+    Offsets to add to each channel before quantizing to a palette for ordered
+    dithering, one pattern high, where spread is the distance between the
+    levels of a channel in the palette
+    """
+
+    offsets = ((tile_bayer_matrix(width) - 0.5) * spread).round().astype(np.int16)
+    # The same offset for each channel; repeated rather than broadcast, adding
+    # arrays of the same shape is several times faster
+    return np.repeat(offsets[:, :, np.newaxis], 3, axis=2)
+
+
+def ordered_dither(in_im, palette: List[int]):
+    """\
+    Add the ordered dithering pattern to an RGB image, so quantizing it
+    without dithering picks palette colors in proportion to how close they
+    are.  Unlike error diffusion each pixel only depends on its own color and
+    position, so a change on the screen only changes those pixels.
+    """
+
+    # The palettes are roughly a cube of levels per channel, 8 colors is 2
+    levels = max(2, round(len(palette) ** (1 / 3)))
+    offsets = get_ordered_offsets(in_im.size[0], 255 // (levels - 1))
+    pixels = np.asarray(in_im.convert('RGB'), dtype=np.int16)
+    apply_bayer_rows(np.add, pixels, offsets, pixels)
+    np.clip(pixels, 0, 255, out=pixels)
+    return Image.fromarray(pixels.astype(np.uint8), 'RGB')
+
+
+@functools.lru_cache()
+def get_palette_image(color_spec: str):
+    """\
+    A palette image for quantizing to a color spec's palette, built once.
+    Pillow maps colors to the palette through its own lookup table, which is
+    much faster than dithering.
+    """
+
+    im = Image.new('P', (1, 1))
+    im.putpalette(convert_palette(COLOR_SPEC[color_spec]['palette']))
+    return im
+
+
+def convert_colors__cs(color_spec: str, in_im, dither: str='floydsteinberg'):
     """Initial conversion to what's specified in color_spec"""
     cs = COLOR_SPEC.get(color_spec, COLOR_SPEC['1b'])
 
     if cs['bits'] == 1:
-        mode = '1'
+        if dither == 'ordered':
+            return threshold_1bit(in_im, get_ordered_thresholds(in_im.size[0]))
+        return threshold_1bit(in_im)
     elif cs['bits'] < 16:
         mode = 'P'
     else:
@@ -35,15 +159,13 @@ def convert_colors__cs(color_spec: str, in_im):
     if cs['palette'] and cs['bits'] < 16 and cs['bits'] > 1:
         out_im.putpalette(convert_palette(cs['palette']))
 
-    if cs['bits'] == 1:
-        in_im = in_im.convert('L')
-        in_im = in_im.point(lambda p: 255 if p >= 170 else 0)
-        out_im.paste(in_im, tuple([0, 0] + list(in_im.size)))
-    elif cs['bits'] < 16:
+    if cs['bits'] < 16:
+        if dither == 'ordered' and cs['palette']:
+            in_im = ordered_dither(in_im, cs['palette'])
         in_im = in_im.quantize(
             colors=len(cs['palette'] or []) or 2 ** cs['bits'],
-            palette=out_im if cs['palette'] else None,
-            dither=Image.Dither.FLOYDSTEINBERG,
+            palette=get_palette_image(cs['key']) if cs['palette'] else None,
+            dither=DITHER_METHODS[dither],
         )
         out_im.paste(in_im, tuple([0, 0] + list(in_im.size)))
     else:
@@ -60,16 +182,178 @@ def convert_colors__bits(bit_depth: Optional[int], in_im):
             return in_im.convert('RGB')
         else:
             # must be 1, 16, 24 - this case would be 1 bit
-            out_im = Image.new('1', in_im.size)
-            in_im = in_im.convert('L')
-            in_im = in_im.point(lambda p: 255 if p >= 170 else 0)
-            out_im.paste(in_im, tuple([0, 0] + list(in_im.size)))
-            return out_im
+            return threshold_1bit(in_im)
     return in_im
 
 
-def convert_colors(bit_depth: Optional[int], color_spec: str, input_path: str):
-    im = Image.open(input_path).convert('RGB')
-    im = convert_colors__cs(color_spec, im)
-    im = convert_colors__bits(bit_depth, im)
+# Rows of the band above that each band is dithered with, see convert_colors__banded
+BAND_OVERLAP = 8
+
+
+def convert_colors__banded(bit_depth: Optional[int], color_spec: str, in_im, dither: str, band_height: int):
+    """\
+    Convert an image in horizontal bands, so only one band's intermediate
+    images exist at a time rather than several copies of the whole image; the
+    decoded image itself is still held whole.
+
+    The result is only approximately that of converting the whole image when
+    Floyd-Steinberg dithering to a palette.  Pillow can't be given the error
+    it carries from one row to the next, so each band is dithered with the
+    last rows of the band above, which are then cropped off.  The error they
+    build up carries over the boundary rather than each band starting from
+    none, which would show as seams, but it isn't the same error, and the
+    dither pattern below the first band differs in many pixels.  The other
+    methods, and 1 bit output, only depend on each pixel and are identical.
+    """
+
+    # Keep ordered dithering's pattern aligned from one band to the next
+    band_height += -band_height % BAYER_SIZE
+    overlap = BAND_OVERLAP if dither == 'floydsteinberg' else 0
+    width, height = in_im.size
+    out_im = None
+    for y in range(0, height, band_height):
+        top = max(0, y - overlap)
+        with timed('decode'):
+            band = in_im.crop((0, top, width, min(height, y + band_height))).convert('RGB')
+        with timed('cs'):
+            band = convert_colors__cs(color_spec, band, dither)
+        with timed('bits'):
+            band = convert_colors__bits(bit_depth, band)
+        if top < y:
+            band = band.crop((0, y - top, width, band.height))
+        if out_im is None:
+            out_im = Image.new(band.mode, in_im.size)
+            if band.mode == 'P':
+                out_im.putpalette(band.getpalette())
+        out_im.paste(band, (0, y))
+    return out_im
+
+
+def convert_colors(bit_depth: Optional[int], color_spec: str, data: Union[bytes, Image.Image], dither: str='floydsteinberg', band_height: int=0):
+    """\
+    Convert a screenshot (PNG data) or image for a display.  Images taller
+    than band_height, if given, are converted in bands of that many rows.
+    """
+
+    with timed('decode'):
+        im = data if isinstance(data, Image.Image) else Image.open(BytesIO(data))
+        if band_height and im.size[1] > band_height:
+            im.load()
+        else:
+            im = im.convert('RGB')
+    if band_height and im.size[1] > band_height:
+        return convert_colors__banded(bit_depth, color_spec, im, dither, band_height)
+    with timed('cs'):
+        im = convert_colors__cs(color_spec, im, dither)
+    with timed('bits'):
+        im = convert_colors__bits(bit_depth, im)
     return im
+
+
+def encode_rgb565(im) -> bytes:
+    """RGB565 pixels, little endian"""
+    r, g, b = im.convert('RGB').split()
+    # The shifted channels don't overlap, so adding them can't overflow
+    low = ImageChops.add(g.point(lambda v: (v << 3) & 0xe0), b.point(lambda v: v >> 3))
+    high = ImageChops.add(r.point(lambda v: v & 0xf8), g.point(lambda v: v >> 5))
+    return Image.merge('LA', (low, high)).tobytes()
+
+
+def decode_rgb565(size: Tuple[int, int], data: bytes):
+    low, high = Image.frombytes('LA', size, data).split()
+    r = high.point(lambda v: v & 0xf8)
+    g = ImageChops.add(high.point(lambda v: (v & 0x07) << 5), low.point(lambda v: (v & 0xe0) >> 3))
+    b = low.point(lambda v: (v & 0x1f) << 3)
+    return Image.merge('RGB', (r, g, b))
+
+
+def encode_raw(im, bits: int) -> bytes:
+    """\
+    Encode an image as raw pixel data for displays that can't decode images:
+
+    * "FSR" + bits per pixel (1 byte), width, height (u16 each, little endian)
+    * rows of pixels, top to bottom; for 1, 2 and 4 bits per pixel the
+      leftmost pixel is in the most significant bits and each row is padded
+      to a whole byte
+      * 1 bit: 0 is black, 1 is white
+      * 2/4 bits: indexes into the color spec's palette
+      * 16 bits: RGB565, little endian
+    """
+
+    header = b'FSR' + struct.pack('<BHH', bits, *im.size)
+    if bits == 16:
+        return header + encode_rgb565(im)
+    if bits == 1:
+        return header + convert_colors__bits(1, im).tobytes('raw', '1')
+
+    if im.mode == '1':
+        im = im.convert('L').point(lambda p: 1 if p else 0).convert('P')
+    if im.mode != 'P':
+        raise ValueError(f"{bits} bit raw images need a color spec with a palette")
+    max_index = im.getextrema()[1] or 0
+    if max_index >= 2 ** bits:
+        raise ValueError(f"Palette index {max_index} doesn't fit in {bits} bits per pixel")
+    return header + im.tobytes('raw', f'P;{bits}')
+
+
+def decode_raw(data: bytes):
+    if data[:3] != b'FSR':
+        raise ValueError("Not a raw image")
+    bits, width, height = struct.unpack('<BHH', data[3:8])
+    if bits == 16:
+        return decode_rgb565((width, height), data[8:])
+    if bits == 1:
+        return Image.frombytes('1', (width, height), data[8:])
+    im = Image.frombytes('P', (width, height), data[8:], 'raw', f'P;{bits}')
+    # The palette isn't included, use one where each index is a distinct gray
+    im.putpalette([v for v in range(256) for _ in range(3)])
+    return im
+
+
+def encode_image(im, fmt: str) -> bytes:
+    """Encode an image in one of the display image formats"""
+    if IMAGE_FORMAT[fmt].get('bits'):
+        return encode_raw(im, IMAGE_FORMAT[fmt]['bits'])
+    out = BytesIO()
+    im.save(out, fmt.lower())
+    return out.getvalue()
+
+
+def decode_image(data: bytes):
+    if data[:3] == b'FSR':
+        return decode_raw(data)
+    return Image.open(BytesIO(data))
+
+
+def get_changed_rects(old_im, new_im, band_height: int=16, align: int=8) -> List[Tuple[int, int, int, int]]:
+    """\
+    Find the areas that differ between two images of the same size as a list of
+    (x, y, width, height).  The image is scanned in horizontal bands, and runs
+    of changed bands are merged into one rectangle.  Horizontal edges are
+    aligned to `align` pixels as partial refresh usually works on whole bytes.
+    """
+
+    width, height = new_im.size
+    diff = ImageChops.difference(old_im.convert('RGB'), new_im.convert('RGB'))
+
+    rects = []
+    current = None
+    for band_y in range(0, height, band_height):
+        bbox = diff.crop((0, band_y, width, min(band_y + band_height, height))).getbbox()
+        if not bbox:
+            current = None
+            continue
+
+        x0, y0, x1, y1 = bbox
+        x0 = x0 - x0 % align
+        x1 = min(width, x1 + (-x1 % align))
+        if current:
+            # The previous band also changed, extend that rectangle
+            current[0] = min(current[0], x0)
+            current[2] = max(current[2], x1)
+            current[3] = band_y + y1
+        else:
+            current = [x0, band_y + y0, x1, band_y + y1]
+            rects.append(current)
+
+    return [(x0, y0, x1 - x0, y1 - y0) for x0, y0, x1, y1 in rects]
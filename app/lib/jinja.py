@@ -2,7 +2,7 @@ from flask import current_app
 from markupsafe import Markup
 import arrow
 
-from app.constants import DISPLAY_SPEC, COLOR_SPEC
+from app.constants import DISPLAY_SPEC, COLOR_SPEC, IMAGE_FORMAT
 from app.lib.user import users_enabled
 
 
@@ -131,6 +131,8 @@ def image_format(value):
         level = 'primary'
     if value == 'PNG':
         level = 'success'
+    if IMAGE_FORMAT.get(getattr(value, 'code', value), {}).get('bits'):
+        level = 'warning'
     return label(value, level=level)
 
 
@@ -0,0 +1,207 @@
+from typing import Optional, IO, Dict, Any
+from contextlib import contextmanager
+import os
+import json
+import time
+import uuid
+import fcntl
+import tempfile
+import threading
+
+from flask import Flask
+
+
+class RenderBusy(Exception):
+    """\
+    Raised when there are too many renders queued, or a render waited too long
+    for a slot
+    """
+
+    def __init__(self, message: str, retry_after: int):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+def pid_running(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        # Running as another user, which may be a reused pid
+        return True
+    return True
+
+
+class RenderLimiter:
+    """\
+    Limits the number of renders running at once across all processes on this
+    host, using a lock file per render slot.  Renders that can't get a slot
+    wait in a bounded queue, and are rejected with RenderBusy once it's full or
+    they have waited too long.
+    """
+
+    poll_interval: float = 0.05
+
+    def __init__(self, app: Optional[Flask]=None):
+        self.lock_dir = None
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app: Flask):
+        self.lock_dir = app.config.get('RENDER_LOCK_DIR') or os.path.join(tempfile.gettempdir(), 'fruitstand-render')
+        self.slots = app.config['RENDER_CONCURRENCY']
+        self.queue_size = app.config['RENDER_QUEUE_SIZE']
+        self.queue_timeout = app.config['RENDER_QUEUE_TIMEOUT']
+        self.retry_after = app.config['RENDER_RETRY_AFTER']
+        self.queue_dir = os.path.join(self.lock_dir, 'queue')
+        os.makedirs(self.queue_dir, exist_ok=True)
+
+    def _path(self, name: str) -> str:
+        return os.path.join(self.lock_dir, name)
+
+    def _try_lock(self, path: str) -> Optional[IO]:
+        fp = open(path, 'a')
+        try:
+            fcntl.flock(fp, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            fp.close()
+            return None
+        return fp
+
+    def _try_acquire(self) -> Optional[IO]:
+        for i in range(self.slots):
+            fp = self._try_lock(self._path(f'slot-{i}.lock'))
+            if fp:
+                return fp
+        return None
+
+    @contextmanager
+    def _state_lock(self):
+        with open(self._path('state.lock'), 'a') as fp:
+            fcntl.flock(fp, fcntl.LOCK_EX)
+            yield
+
+    def _get_queued(self) -> int:
+        """\
+        Count the renders waiting for a slot, cleaning up after processes that
+        died while waiting, including those whose pid has since been reused.
+        Must hold the state lock.
+        """
+
+        queued = 0
+        now = time.time()
+        for name in os.listdir(self.queue_dir):
+            path = os.path.join(self.queue_dir, name)
+            pid = int(name.split('-')[0])
+            try:
+                # Waiters give up after the queue timeout, so an entry much
+                # older than that was left by a process whose pid was reused
+                live = pid_running(pid) and now - os.path.getmtime(path) < self.queue_timeout * 2
+            except FileNotFoundError:
+                # Its waiter just left the queue
+                continue
+            if live:
+                queued += 1
+            else:
+                try:
+                    os.unlink(path)
+                except FileNotFoundError:
+                    pass
+        return queued
+
+    def _update_stats(self, **kwargs):
+        """\
+        Update the shared stats; kwargs are added to the current values, except
+        max_wait which is kept as a maximum.  Must hold the state lock.
+        """
+
+        stats = self._read_stats()
+        for k, v in kwargs.items():
+            if k == 'max_wait':
+                stats[k] = max(stats[k], v)
+            else:
+                stats[k] += v
+        with open(self._path('stats.json'), 'w') as fp:
+            json.dump(stats, fp)
+
+    def _read_stats(self) -> Dict[str, Any]:
+        stats = {'renders': 0, 'shed': 0, 'total_wait': 0.0, 'max_wait': 0.0}
+        try:
+            with open(self._path('stats.json'), 'r') as fp:
+                stats.update(json.load(fp))
+        except (OSError, ValueError):
+            pass
+        return stats
+
+    @contextmanager
+    def slot(self, timeout: Optional[float]=None):
+        """\
+        Hold a render slot for the duration of the block.  The wait for a slot
+        is limited to the configured queue timeout, or `timeout` if shorter.
+        """
+
+        if timeout is None or timeout > self.queue_timeout:
+            timeout = self.queue_timeout
+        start = time.monotonic()
+        fp = self._try_acquire()
+        if fp is None:
+            queue_path = os.path.join(self.queue_dir, f'{os.getpid()}-{threading.get_ident()}-{uuid.uuid4()}')
+            with self._state_lock():
+                if self._get_queued() >= self.queue_size:
+                    self._update_stats(shed=1)
+                    raise RenderBusy("Render queue is full", self.retry_after)
+                open(queue_path, 'w').close()
+
+            try:
+                while fp is None:
+                    if time.monotonic() - start >= timeout:
+                        with self._state_lock():
+                            self._update_stats(shed=1)
+                        raise RenderBusy("Timed out waiting for a render slot", self.retry_after)
+                    time.sleep(self.poll_interval)
+                    fp = self._try_acquire()
+            finally:
+                try:
+                    os.unlink(queue_path)
+                except FileNotFoundError:
+                    # Cleaned up as stale by another process
+                    pass
+
+        wait = time.monotonic() - start
+        with self._state_lock():
+            self._update_stats(renders=1, total_wait=wait, max_wait=wait)
+        try:
+            yield
+        finally:
+            fp.close()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """\
+        Current slot usage and queue depth, plus totals since the stats were
+        last reset, for monitoring
+        """
+
+        busy = 0
+        for i in range(self.slots):
+            fp = self._try_lock(self._path(f'slot-{i}.lock'))
+            if fp:
+                fp.close()
+            else:
+                busy += 1
+
+        with self._state_lock():
+            stats = self._read_stats()
+            stats['queued'] = self._get_queued()
+        stats.update({
+            'slots': self.slots,
+            'busy': busy,
+            'queue_size': self.queue_size,
+            'avg_wait': stats['total_wait'] / stats['renders'] if stats['renders'] else 0.0,
+        })
+        return stats
+
+    def reset_stats(self):
+        with self._state_lock():
+            if os.path.exists(self._path('stats.json')):
+                os.unlink(self._path('stats.json'))
@@ -0,0 +1,177 @@
+from typing import Optional, Dict, List, Tuple
+import time
+
+from flask import request, current_app
+import arrow
+
+from app import cache
+from app.models import Display
+from app.lib.cache import make_key_with_args
+from app.lib.screen import Screen
+from app.lib.render import Frame, render_frames, get_screen_url
+
+
+def get_screen_key(screen: Screen) -> str:
+    """\
+    Identify what a screen will render on its display, so a prerendered frame
+    is only used for the screen & output settings it was rendered for
+    """
+
+    display = screen.display
+    return make_key_with_args(
+        screen.key,
+        screen.playlist_screen.id if screen.playlist_screen else None,
+        display.width,
+        display.height,
+        display.color_spec.code,
+        display.image_format.code,
+        display.image_bit_depth,
+        display.dither.code,
+    )
+
+
+def save_render_args(display: Display):
+    """\
+    Remember the arguments a display polls with (metrics etc.) so its next
+    frame can be rendered before it polls again
+    """
+
+    args = {k: v for k, v in request.args.lists() if not k.startswith('debug_')}
+    cache.set(f'fs-render-args-{display.id}', current_app.config['PRERENDER_ARGS_EXPIRY'], args)
+
+
+def get_render_args(display: Display) -> Optional[Dict[str, List[str]]]:
+    return cache.get(f'fs-render-args-{display.id}')
+
+
+def pop_prerendered_frame(screen: Screen) -> Optional[Frame]:
+    """\
+    Get the frame prerendered for this screen, if any.  A prerendered frame is
+    only used once.
+    """
+
+    key = f'fs-prerender-{screen.display.id}'
+    entry = cache.get(key)
+    if entry and entry['screen_key'] == get_screen_key(screen):
+        cache.delete(key)
+        cancel_render(screen.display)
+        frame = entry['frame']
+        frame.source = 'prerendered'
+        return frame
+
+
+def request_render(screen: Screen) -> float:
+    """\
+    Ask the prerender scheduler to render a screen's frame as soon as it can,
+    rather than waiting until its display is due.  Returns when the render
+    was first requested.
+    """
+
+    key = f'fs-render-wanted-{screen.display.id}'
+    screen_key = get_screen_key(screen)
+    wanted = cache.get(key)
+    if not (wanted and wanted['screen_key'] == screen_key):
+        wanted = {'screen_key': screen_key, 'requested_at': time.time()}
+        cache.set(key, current_app.config['PRERENDER_MAX_AGE'], wanted)
+    return wanted['requested_at']
+
+
+def is_render_wanted(display: Display) -> bool:
+    return cache.get(f'fs-render-wanted-{display.id}') is not None
+
+
+def cancel_render(display: Display):
+    cache.delete(f'fs-render-wanted-{display.id}')
+
+
+def get_due_displays(lead: int, grace: int) -> List[Display]:
+    """\
+    Get displays that are expected to poll within the next `lead` seconds, or
+    that are waiting for a frame.  Displays more than `grace` seconds late
+    have likely stopped polling, and aren't rendered for until they're back.
+    """
+
+    now = arrow.utcnow()
+    cutoff = now.shift(seconds=lead)
+    overdue = now.shift(seconds=-grace)
+    displays = Display.query.filter(
+        Display.playlist_id != None,
+        Display.display_spec != 'browser',
+        Display.status == 'active',
+    )
+    out = []
+    for display in displays:
+        next_poll_at = display.get_next_poll_at()
+        if (next_poll_at and overdue <= next_poll_at <= cutoff) or is_render_wanted(display):
+            out.append(display)
+    return out
+
+
+def load_next_screen(display: Display) -> Optional[Tuple[Screen, str, str, str]]:
+    """\
+    Load the next screen in a display's playlist as it would be loaded when
+    the display polls, and generate its HTML.  Returns (screen, screen key,
+    HTML, URL), or None if there's nothing to prerender.
+    """
+
+    args = get_render_args(display)
+    if args is None:
+        # Hasn't polled recently, there's nothing to base the render on
+        return None
+
+    _, playlist_screen = display.get_playlist_screen(advance=False)
+    if not playlist_screen:
+        return None
+
+    with current_app.test_request_context('/display/render', query_string=args):
+        screen = Screen.load_for_render(display_id=display.id, playlist_screen_id=playlist_screen.id)
+        if screen.system:
+            return None
+
+        screen_key = get_screen_key(screen)
+        entry = cache.get(f'fs-prerender-{display.id}')
+        if entry and entry['screen_key'] == screen_key:
+            # Already rendered
+            return None
+
+        return screen, screen_key, screen.render_html(), get_screen_url(screen)
+
+
+def prerender_displays(displays: List[Display]) -> Tuple[List[Display], List[Tuple[Display, Exception]]]:
+    """\
+    Render the next frame in each display's playlist and store it to be sent
+    when the display next polls.  Displays showing the same page are rendered
+    together, loading the page once for all of them.  Returns the displays a
+    frame was rendered for, and the displays that failed with their errors.
+    """
+
+    rendered, failed = [], []
+    batches = {}
+    for display in displays:
+        try:
+            loaded = load_next_screen(display)
+        except Exception as e:
+            failed.append((display, e))
+            continue
+        if loaded is None:
+            continue
+
+        screen, screen_key, html, url = loaded
+        batch_key = (html,) if screen.resizable else (html, display.width, display.height)
+        batches.setdefault(batch_key, (html, url, []))[2].append((screen, screen_key))
+
+    for html, url, entries in batches.values():
+        try:
+            frames = render_frames([screen for screen, _ in entries], html, url)
+        except Exception as e:
+            failed += [(screen.display, e) for screen, _ in entries]
+            continue
+
+        for (screen, screen_key), frame in zip(entries, frames):
+            cache.set(f'fs-prerender-{screen.display.id}', current_app.config['PRERENDER_MAX_AGE'], {
+                'screen_key': screen_key,
+                'frame': frame,
+            })
+            cancel_render(screen.display)
+            rendered.append(screen.display)
+    return rendered, failed
@@ -0,0 +1,77 @@
+from typing import List, Tuple, Literal
+import os
+import functools
+
+from flask import current_app
+from PIL import Image, ImageDraw, ImageFont
+
+
+FONT_DIR = 'fonts/liberation-sans-fontfacekit/web fonts'
+FONTS = {
+    False: 'liberationsans_regular/LiberationSans-Regular-webfont.woff',
+    True: 'liberationsans_bold/LiberationSans-Bold-webfont.woff',
+}
+
+# A block of text: (text, size in px, bold)
+TextBlock = Tuple[str, int, bool]
+
+
+@functools.lru_cache()
+def get_font(size: int, bold: bool=False):
+    """\
+    Load the font the screen templates use, at a size in pixels
+    """
+
+    try:
+        return ImageFont.truetype(os.path.join(current_app.static_folder, FONT_DIR, FONTS[bold]), size)
+    except OSError:
+        # FreeType might have been built without WOFF support
+        return ImageFont.load_default(size)
+
+
+def wrap_text(draw: ImageDraw.ImageDraw, text: str, font, width: int) -> List[str]:
+    """\
+    Split text into lines no wider than width, breaking between words
+    """
+
+    lines = []
+    line = ''
+    for word in text.split():
+        candidate = f'{line} {word}' if line else word
+        if line and draw.textlength(candidate, font=font) > width:
+            lines.append(line)
+            line = word
+        else:
+            line = candidate
+    if line:
+        lines.append(line)
+    return lines
+
+
+def draw_text_blocks(im: Image.Image, blocks: List[TextBlock], align: Literal['left', 'center']='center', margin: int=8):
+    """\
+    Draw blocks of text on an image, wrapped to its width and centered
+    vertically, with a gap of half a line between blocks
+    """
+
+    draw = ImageDraw.Draw(im)
+    # Don't antialias, to match how the browser renders for displays
+    draw.fontmode = '1'
+    width = im.width - margin * 2
+
+    lines = []
+    for i, (text, size, bold) in enumerate(blocks):
+        font = get_font(size, bold)
+        for j, line in enumerate(wrap_text(draw, text, font, width)):
+            gap = size // 2 if i and not j else 0
+            lines.append((line, font, size * 6 // 5, gap))
+
+    height = sum(line_height + gap for _, _, line_height, gap in lines)
+    y = max(margin, (im.height - height) // 2)
+    for line, font, line_height, gap in lines:
+        y += gap
+        x = margin
+        if align == 'center':
+            x = (im.width - draw.textlength(line, font=font)) // 2
+        draw.text((x, y), line, font=font, fill=(0, 0, 0))
+        y += line_height
@@ -0,0 +1,622 @@
+from typing import Optional, List, Tuple, Union, Dict
+import os
+import json
+import time
+import zlib
+import socket
+import struct
+import signal
+import hashlib
+import subprocess
+import concurrent.futures
+from concurrent.futures.process import BrokenProcessPool
+
+from flask import current_app, url_for, g
+from werkzeug.datastructures import ETags, Accept
+from werkzeug.http import quote_etag
+from PIL import Image
+
+from app import cache, render_limiter, convert_pool
+from app.constants import IMAGE_FORMAT
+from app.lib.cache import make_key_with_args
+from app.lib.metric import Metric
+from app.lib.compress import packbits
+from app.lib.image import convert_colors, encode_image, decode_image, get_changed_rects
+from app.lib.timing import timed, record_timing
+
+
+class RenderError(Exception):pass
+class RenderTimeout(RenderError):pass
+
+
+FRAME_ENCODINGS = {
+    # Name used in the z parameter: (Content-Encoding, compression function)
+    'deflate': ('deflate', zlib.compress),
+    'rle': ('x-fruitstand-rle', packbits),
+}
+
+
+def get_service_address(address: str) -> Tuple[int, Union[str, Tuple[str, int]]]:
+    """\
+    Parse the configured render service address, either "host:port" for TCP or
+    a path to a unix socket
+    """
+
+    host, sep, port = address.rpartition(':')
+    if sep and port.isdigit():
+        return socket.AF_INET, (host or '127.0.0.1', int(port))
+    return socket.AF_UNIX, address
+
+
+def send_render_job(job: dict, timeout: float) -> List[bytes]:
+    """\
+    Send a job to the render service and wait for the screenshots, one per
+    viewport
+    """
+
+    family, address = get_service_address(current_app.config['RENDER_SOCKET'])
+    try:
+        with socket.socket(family, socket.SOCK_STREAM) as sock:
+            sock.settimeout(timeout)
+            sock.connect(address)
+            sock.sendall(json.dumps(job).encode('utf-8') + b'\n')
+            with sock.makefile('rb') as fp:
+                try:
+                    res = json.loads(fp.readline())
+                except ValueError as e:
+                    raise RenderError("Invalid response from render service") from e
+                if not res.get('ok'):
+                    raise RenderError(res.get('error') or "Unknown render service error")
+                # A successful response line is followed by the screenshot data
+                screenshots = []
+                for length in res['lengths']:
+                    data = fp.read(length)
+                    if len(data) != length:
+                        raise RenderError("Incomplete response from render service")
+                    screenshots.append(data)
+    except OSError as e:
+        raise RenderError(f"Render service error: {e}") from e
+
+    return screenshots
+
+
+def get_static_map() -> Dict[str, str]:
+    """\
+    Map the URL paths static files are served from (the app's and each
+    screen's) to their directories, so the renderer can load them from disk
+    instead of requesting them from the server
+    """
+
+    static_map = {}
+    for rule in current_app.url_map.iter_rules():
+        if rule.endpoint == 'static':
+            folder = current_app.static_folder
+        elif rule.endpoint.endswith('.static'):
+            folder = current_app.blueprints[rule.endpoint.rsplit('.', 1)[0]].static_folder
+        else:
+            continue
+        if folder and os.path.isdir(folder):
+            # e.g. /static/<path:filename> -> /static/
+            static_map[rule.rule.split('<', 1)[0]] = folder
+    return static_map
+
+
+def get_screenshot_timeout(timeout: Optional[float]) -> float:
+    """\
+    Time allowed for a screenshot: RENDER_TIMEOUT, or less if given.  Raises
+    RenderTimeout if none is left, e.g. a deadline already spent.
+    """
+
+    if timeout is None:
+        return current_app.config['RENDER_TIMEOUT']
+    if timeout <= 0:
+        raise RenderTimeout("No time left for the screenshot")
+    return min(timeout, current_app.config['RENDER_TIMEOUT'])
+
+
+def kill_process_group(proc: subprocess.Popen):
+    """\
+    Kill a process started in its own session and everything it started,
+    and wait for it
+    """
+
+    try:
+        os.killpg(proc.pid, signal.SIGKILL)
+    except ProcessLookupError:
+        pass
+    proc.communicate()
+
+
+def screenshot(url: str, width: int, height: int, html: Optional[str]=None, timeout: Optional[float]=None, warm: Optional[str]=None) -> bytes:
+    """\
+    Render a URL and return the screenshot as PNG data.  If a render service is
+    configured the job is sent there, otherwise a new browser is started for
+    this render.  If html is given it is used as the page content instead of
+    fetching the URL, which is then only used to resolve the page's assets.
+    The render service keeps the page loaded for later renders with the same
+    warm key, and updates it with their HTML rather than loading it again
+    (see get_warm_key).
+    """
+
+    timeout = get_screenshot_timeout(timeout)
+    if current_app.config.get('RENDER_SOCKET'):
+        return send_render_job({
+            'url': url,
+            'width': width,
+            'height': height,
+            'html': html,
+            'timeout': int(timeout * 1000),
+            'readyTimeout': current_app.config['RENDER_READY_TIMEOUT'] * 1000,
+            'static': get_static_map(),
+            'warm': warm,
+        }, timeout)[0]
+
+    try:
+        # In its own process group, so the browser npm and node start under it
+        # can be killed along with it
+        proc = subprocess.Popen(list(filter(None, [
+            'npm', 'run', '--silent', 'render', '--',
+            '--url', url,
+            '--width', str(width),
+            '--height', str(height),
+            '--browser', current_app.config['BROWSER'],
+            '--timeout', str(int(timeout * 1000)),
+            '--ready-timeout', str(current_app.config['RENDER_READY_TIMEOUT'] * 1000),
+            '--static-map', json.dumps(get_static_map()),
+            '--stdin-html' if html is not None else None,
+        ])), stdin=subprocess.PIPE if html is not None else None, stdout=subprocess.PIPE, start_new_session=True)
+    except OSError as e:
+        raise RenderError(f"Render failed: {e}") from e
+    try:
+        stdout, _ = proc.communicate(html.encode('utf-8') if html is not None else None, timeout=timeout)
+    except subprocess.TimeoutExpired as e:
+        raise RenderTimeout(f"Render timed out after {timeout}s") from e
+    finally:
+        if proc.poll() is None or proc.returncode:
+            kill_process_group(proc)
+    if proc.returncode:
+        raise RenderError(f"Render failed: exited with status {proc.returncode}")
+    return stdout
+
+
+def screenshot_viewports(url: str, viewports: List[Tuple[int, int]], html: Optional[str]=None, timeout: Optional[float]=None, warm: Optional[str]=None) -> List[bytes]:
+    """\
+    Render a URL at several viewport sizes, returning a screenshot for each.
+    The render service loads the page once and resizes it for each viewport;
+    without it each viewport is a separate render.
+    """
+
+    timeout = get_screenshot_timeout(timeout)
+    if current_app.config.get('RENDER_SOCKET'):
+        return send_render_job({
+            'url': url,
+            'viewports': [{'width': w, 'height': h} for w, h in viewports],
+            'html': html,
+            'timeout': int(timeout * 1000),
+            'readyTimeout': current_app.config['RENDER_READY_TIMEOUT'] * 1000,
+            'static': get_static_map(),
+            'warm': warm,
+        }, timeout)
+
+    deadline = Deadline(timeout)
+    return [screenshot(url, w, h, html=html, timeout=deadline.remaining()) for w, h in viewports]
+
+
+class Deadline:
+    """\
+    Time limit for a render, shared by all of its stages
+    """
+
+    def __init__(self, seconds: float):
+        self.seconds = seconds
+        self.expires = time.monotonic() + seconds
+
+    def remaining(self) -> float:
+        return max(0.0, self.expires - time.monotonic())
+
+    def check(self, stage: str):
+        if time.monotonic() >= self.expires:
+            raise RenderTimeout(f"Render deadline of {self.seconds}s exceeded after {stage}")
+
+
+def record_render_time(seconds: float):
+    """\
+    Track how long renders take, as an exponentially weighted moving average
+    """
+
+    average = cache.get('fs-render-time')
+    if average is not None:
+        seconds = average + (seconds - average) * 0.2
+    cache.set('fs-render-time', 7 * 86400, seconds)
+
+
+def get_render_time() -> float:
+    """\
+    Estimate how long a render takes, from recent renders
+    """
+
+    average = cache.get('fs-render-time')
+    return average if average is not None else current_app.config['RENDER_DEADLINE']
+
+
+def get_upstream_timeout(default: float=30) -> float:
+    """\
+    Timeout for requests screens make to other services, bounded by the
+    deadline of the current render if there is one
+    """
+
+    deadline = g.get('render_deadline')
+    if deadline:
+        # requests doesn't accept a timeout of 0
+        return max(0.1, min(default, deadline.remaining()))
+    return default
+
+
+class Frame:
+    """\
+    A rendered frame, ready to be sent to a display
+    """
+
+    def __init__(self, payload: bytes, mimetype: str):
+        self.payload = payload
+        self.mimetype = mimetype
+        # How the frame was obtained, for reporting: rendered, cached, prerendered
+        self.source = 'rendered'
+
+    @property
+    def etag(self) -> str:
+        return hashlib.sha256(self.payload).hexdigest()
+
+    def is_current(self, etag: Optional[str], if_none_match: ETags) -> bool:
+        """\
+        Determine if the display already has this frame, from the ETag it sent
+        as a query parameter or in If-None-Match
+        """
+
+        # Compressed frames have the encoding appended to their ETag
+        if etag and etag.split('-', 1)[0] == self.etag:
+            return True
+        return any(if_none_match.contains_weak(self.etag + suffix) for suffix in ['', *(f'-{k}' for k in FRAME_ENCODINGS)])
+
+    def get_headers(self) -> dict:
+        return {
+            'Content-length': len(self.payload),
+            'Content-type': self.mimetype,
+            'ETag': quote_etag(self.etag),
+            'X-Frame-Source': self.source,
+        }
+
+
+class DeltaFrame(Frame):
+    """\
+    A frame containing only the areas that changed since the display's
+    previous frame.  Its ETag is that of the full frame it produces.
+
+    Format, all integers little endian:
+    * "FSD" + format version (1 byte)
+    * width, height, number of rectangles (u16 each)
+    * for each rectangle: x, y, width, height (u16 each), data length (u32),
+      then the rectangle's image data in the display's image format
+    """
+
+    mimetype_delta = 'application/x-fruitstand-delta'
+    version = 1
+
+    def __init__(self, frame: Frame, size: Tuple[int, int], rects: List[Tuple[Tuple[int, int, int, int], bytes]]):
+        payload = [b'FSD', struct.pack('<BHHH', self.version, size[0], size[1], len(rects))]
+        for rect, data in rects:
+            payload.append(struct.pack('<HHHHI', *rect, len(data)))
+            payload.append(data)
+        super().__init__(b''.join(payload), self.mimetype_delta)
+        self.frame_etag = frame.etag
+        self.source = frame.source
+
+    @property
+    def etag(self) -> str:
+        return self.frame_etag
+
+
+class CompressedFrame(Frame):
+    """\
+    A frame compressed for sending, see FRAME_ENCODINGS.  Its ETag is that of
+    the uncompressed frame with the encoding appended.
+    """
+
+    def __init__(self, frame: Frame, encoding: str, payload: bytes):
+        super().__init__(payload, frame.mimetype)
+        self.frame_etag = frame.etag
+        self.encoding = encoding
+        self.source = frame.source
+
+    @property
+    def etag(self) -> str:
+        return f'{self.frame_etag}-{self.encoding}'
+
+    def get_headers(self) -> dict:
+        headers = super().get_headers()
+        headers['Content-Encoding'] = FRAME_ENCODINGS[self.encoding][0]
+        return headers
+
+
+def get_frame_encoding(z: Optional[str], accept_encodings: Accept) -> Optional[str]:
+    """\
+    Choose how to compress frames for a display, from its z parameter or
+    otherwise its Accept-Encoding header
+    """
+
+    if z:
+        return z if z in FRAME_ENCODINGS else None
+    names = {content_encoding: k for k, (content_encoding, _) in FRAME_ENCODINGS.items()}
+    return names.get(accept_encodings.best_match(list(names)))
+
+
+def compress_frame(frame: Frame, encoding: str) -> Frame:
+    """\
+    Compress a frame for sending, unless that doesn't make it smaller.  The
+    compressed payload is cached by content, so a frame is only compressed
+    once however many times and to however many displays it's sent.
+    """
+
+    key = f'fs-frame-{encoding}-{hashlib.sha256(frame.payload).hexdigest()}'
+    payload = cache.get(key)
+    if payload is None:
+        payload = FRAME_ENCODINGS[encoding][1](frame.payload)
+        if len(payload) >= len(frame.payload):
+            # Remember that it's not worth it
+            payload = b''
+        if current_app.config['FRAME_CACHE_EXPIRY']:
+            cache.set(key, current_app.config['FRAME_CACHE_EXPIRY'], payload)
+
+    if not payload:
+        return frame
+    return CompressedFrame(frame, encoding, payload)
+
+
+def make_delta_frame(prev_frame: Frame, frame: Frame, image_format: str) -> Optional[DeltaFrame]:
+    """\
+    Build a delta from the previous frame sent to a display to the new one.
+    Returns None if a delta isn't possible or wouldn't be worth it.
+    """
+
+    if image_format not in IMAGE_FORMAT or prev_frame.mimetype != frame.mimetype:
+        return None
+    if frame.mimetype != IMAGE_FORMAT[image_format]['mimetype']:
+        # Not an image in the display's format, e.g. HTML for browser displays
+        return None
+    if IMAGE_FORMAT[image_format]['lossy']:
+        # Lossy, decoded frames would differ everywhere
+        return None
+
+    prev_im = decode_image(prev_frame.payload)
+    im = decode_image(frame.payload)
+    if prev_im.size != im.size:
+        return None
+
+    rects = get_changed_rects(prev_im, im, band_height=current_app.config['DELTA_BAND_HEIGHT'])
+    changed = sum(w * h for _, _, w, h in rects)
+    if changed > im.size[0] * im.size[1] * current_app.config['DELTA_MAX_RATIO']:
+        return None
+
+    delta = DeltaFrame(frame, im.size, [
+        (rect, encode_image(im.crop((rect[0], rect[1], rect[0] + rect[2], rect[1] + rect[3])), image_format))
+        for rect in rects
+    ])
+    if len(delta.payload) >= len(frame.payload):
+        return None
+    return delta
+
+
+def get_last_frame(display) -> Optional[Frame]:
+    """\
+    Get the last frame sent to a display
+    """
+
+    return cache.get(f'fs-last-frame-{display.id}')
+
+
+def set_last_frame(display, frame: Frame):
+    cache.set(f'fs-last-frame-{display.id}', current_app.config['LAST_FRAME_EXPIRY'], frame)
+
+
+def get_screen_url(screen) -> str:
+    """\
+    Build the URL the screen's HTML is rendered from
+    """
+
+    args = {
+        'playlist_screen_id': screen.playlist_screen.id if screen.playlist_screen else None,
+        'display_id': screen.display.id,
+        'metrics': json.dumps(Metric.get_metrics()),
+        '_render_display': 1,
+    }
+
+    if current_app.config.get('INTERNAL_WEB_HOST'):
+        # the _external argument doesn't work here as it uses the configured host
+        # (or host header, probably localhost) and this is not going to be valid
+        # in certain environments like Docker, so "fix" it
+        return 'http://{}{}'.format(
+            current_app.config['INTERNAL_WEB_HOST'],
+            url_for(screen.route, **args)
+        )
+    return url_for(screen.route, **args, _external=True)
+
+
+def get_warm_key(screen) -> Optional[str]:
+    """\
+    Identify the pages the render service can reuse for a screen, for screens
+    that support it (see Screen.warm_reuse): a page can be updated with new
+    HTML for the same screen and color spec, and the same size unless the
+    screen lays itself out again when resized
+    """
+
+    if not screen.warm_reuse:
+        return None
+    display = screen.display
+    return make_key_with_args(
+        screen.key,
+        display.color_spec.code,
+        *(() if screen.resizable else (display.width, display.height)),
+    )
+
+
+def get_frame_key(screen, html: str) -> str:
+    """\
+    Key for the frame cache; identical HTML rendered with the same output
+    settings produces an identical frame
+    """
+
+    display = screen.display
+    return make_key_with_args(
+        'fs-frame',
+        html,
+        display.width,
+        display.height,
+        display.color_spec.code,
+        display.image_bit_depth,
+        display.image_format.code,
+        display.dither.code,
+    )
+
+
+def get_cached_frame(screen, html: str) -> Optional[Frame]:
+    frame = cache.get(get_frame_key(screen, html))
+    if frame is not None:
+        current_app.logger.info("Frame cache hit for display %s (%s)", screen.display.id, screen.key)
+        frame.source = 'cached'
+        return frame
+    current_app.logger.info("Frame cache miss for display %s (%s)", screen.display.id, screen.key)
+
+
+def get_convert_key(screen, data: bytes) -> str:
+    display = screen.display
+    return make_key_with_args(
+        'fs-convert',
+        hashlib.sha256(data).hexdigest(),
+        display.color_spec.code,
+        display.image_bit_depth,
+        display.image_format.code,
+        display.dither.code,
+    )
+
+
+def convert_frame(screen, data: Union[bytes, Image.Image]) -> Frame:
+    """\
+    Convert a screenshot or image for the screen's display.  Conversions of
+    screenshots are cached by their content, as a page often looks the same
+    as last time even though its HTML changed.
+    """
+
+    key = None
+    if isinstance(data, bytes) and current_app.config['CONVERT_CACHE_EXPIRY']:
+        key = get_convert_key(screen, data)
+        frame = cache.get(key)
+        if frame is not None:
+            current_app.logger.info("Conversion cache hit for display %s (%s)", screen.display.id, screen.key)
+            return frame
+
+    display = screen.display
+    fmt = display.image_format.code
+    payload = None
+    if isinstance(data, bytes) and convert_pool.enabled:
+        # The stages run in the worker, so are timed as one
+        deadline = g.get('render_deadline')
+        try:
+            with timed('convert'):
+                payload = convert_pool.convert(data, display.image_bit_depth, display.color_spec.code, display.dither.code, fmt, current_app.config['CONVERT_BAND_HEIGHT'], timeout=deadline.remaining() if deadline else current_app.config['RENDER_TIMEOUT'])
+        except concurrent.futures.TimeoutError as e:
+            raise RenderTimeout("Render deadline exceeded while converting") from e
+        except BrokenProcessPool as e:
+            current_app.logger.warning("Conversion pool failed (%s), converting for display %s (%s) in the app", e, display.id, screen.key)
+        except ValueError as e:
+            raise RenderError(f"Can't encode frame as {fmt}: {e}") from e
+    if payload is None:
+        im = convert_colors(display.image_bit_depth, display.color_spec, data, display.dither.code, current_app.config['CONVERT_BAND_HEIGHT'])
+        with timed('encode'):
+            try:
+                payload = encode_image(im, fmt)
+            except ValueError as e:
+                # e.g. a raw format without enough bits for the palette, see Display.image_format_fits
+                raise RenderError(f"Can't encode frame as {fmt}: {e}") from e
+    frame = Frame(payload, IMAGE_FORMAT[fmt]['mimetype'])
+    if key:
+        cache.set(key, current_app.config['CONVERT_CACHE_EXPIRY'], frame)
+    return frame
+
+
+def make_frame(screen, html: str, data: bytes) -> Frame:
+    """\
+    Convert a screenshot for the screen's display, and cache the frame
+    """
+
+    frame = convert_frame(screen, data)
+    if current_app.config['FRAME_CACHE_EXPIRY']:
+        cache.set(get_frame_key(screen, html), current_app.config['FRAME_CACHE_EXPIRY'], frame)
+    return frame
+
+
+def render_frame(screen, deadline: Optional[Deadline]=None) -> Frame:
+    """\
+    Render a loaded screen for its display.  If a deadline is given, raises
+    RenderTimeout when rendering takes longer.
+    """
+
+    start = time.monotonic()
+    g.render_deadline = deadline
+    if screen.display.display_spec != 'browser':
+        with timed('raster'):
+            im = screen.raster()
+        if im is not None:
+            # Drawn without a browser, which is cheap enough not to need the cache or a render slot
+            frame = convert_frame(screen, im)
+            frame.source = 'raster'
+            return frame
+
+    with timed('html'):
+        html = screen.render_html()
+    if deadline:
+        deadline.check('generating HTML')
+    if screen.display.display_spec == 'browser':
+        return Frame(html.encode('utf-8'), 'text/html')
+
+    frame = get_cached_frame(screen, html)
+    if frame is not None:
+        return frame
+
+    # The renderer is given the HTML, the URL is only used to load the page's assets
+    url = get_screen_url(screen)
+    queued_at = time.perf_counter()
+    with render_limiter.slot(timeout=deadline.remaining() if deadline else None):
+        record_timing('queue', time.perf_counter() - queued_at)
+        if deadline:
+            deadline.check('waiting for a render slot')
+        with timed('browser'):
+            data = screenshot(url, screen.display.width, screen.display.height, html=html, timeout=deadline.remaining() if deadline else None, warm=get_warm_key(screen))
+        frame = make_frame(screen, html, data)
+    if deadline:
+        deadline.check('converting')
+    record_render_time(time.monotonic() - start)
+    return frame
+
+
+def render_frames(screens: List, html: str, url: str) -> List[Frame]:
+    """\
+    Render a page for several displays at once, returning a frame for each
+    screen.  The page is loaded once and captured at each display's size, so
+    the screens must all produce the same HTML (see Screen.resizable).
+    """
+
+    frames = [get_cached_frame(screen, html) for screen in screens]
+    todo = [screen for screen, frame in zip(screens, frames) if frame is None]
+    if not todo:
+        return frames
+
+    # Displays of the same size share a screenshot
+    viewports = list(dict.fromkeys((s.display.width, s.display.height) for s in todo))
+    start = time.monotonic()
+    with render_limiter.slot():
+        screenshots = dict(zip(viewports, screenshot_viewports(url, viewports, html=html, warm=get_warm_key(todo[0]))))
+        for i, screen in enumerate(screens):
+            if frames[i] is None:
+                frames[i] = make_frame(screen, html, screenshots[(screen.display.width, screen.display.height)])
+    record_render_time(time.monotonic() - start)
+    return frames
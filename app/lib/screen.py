@@ -3,12 +3,14 @@ import json
 import os
 import inspect
 
-from flask import Blueprint, Flask, url_for, request, current_app
+from flask import Blueprint, Flask, url_for, request, current_app, g
 from flask_wtf import FlaskForm
 from jinja2 import Environment, FileSystemLoader, select_autoescape
 
 from app.models import Display, Config, Playlist, PlaylistScreen
 from app.lib.jinja import apply_jinja_to_env
+from app.lib.metric import Metric
+from app.lib.timing import timed
 
 
 class ScreenError(Exception):pass
@@ -28,6 +30,12 @@ class Screen:
     route: str = None
     config_form: Optional[FlaskForm] = None
     default_config: Dict[str, Any] = {}
+    # Whether the page lays itself out again when the viewport is resized, so
+    # it can be rendered once for displays of different sizes
+    resizable: bool = True
+    # Whether the render service can keep the page loaded and update it with
+    # new HTML for the next render, see fsRender.update in the base template
+    warm_reuse: bool = False
     _is_system: bool = False
 
     def __init__(self, display: Display, playlist: Optional[Playlist], playlist_screen: Optional[PlaylistScreen], screen_config: Dict[str, Any], playlist_config: Dict[str, Any], context: Dict[str, Any], system: bool=False):
@@ -70,6 +78,27 @@ class Screen:
         template = self.jinja_env.get_template(template_name)
         return template.render(**kwargs)
 
+    def raster(self):
+        """\
+        Screens that are simple enough to draw without a browser can implement
+        this, returning an RGB PIL image the size of the display.  The image
+        is used instead of rendering the screen's HTML for displays that take
+        images.
+        """
+
+        return None
+
+    def render_html(self) -> str:
+        """\
+        Render this screen's HTML by calling its view directly, rather than
+        requesting it from the server
+        """
+
+        g.screen = self
+        view = current_app.view_functions[self.route]
+        res = current_app.make_response(current_app.ensure_sync(view)())
+        return res.get_data(as_text=True)
+
     @classmethod
     def get_path(cls):
         return os.path.dirname(inspect.getfile(cls))
@@ -101,7 +130,8 @@ class Screen:
         if display_id:
             display = Display.query.get(display_id)
         else:
-            display = Display.sync()
+            with timed('sync'):
+                display = Display.sync()
         if not display:
             raise DisplayNotFound(display_id)
 
@@ -162,7 +192,9 @@ class Screen:
                 display.id
             ))
 
-        context = {'metrics': {}, 'extra': extra_context}
+        # Metrics come from the display's own parameters, or are passed as JSON
+        # when the screen is requested by the renderer
+        context = {'metrics': Metric.get_metrics(), 'extra': extra_context}
         for k in ('metrics', 'extra'):
             # JSON args
             try:
@@ -0,0 +1,106 @@
+from typing import Dict, Optional
+from contextlib import contextmanager
+import sys
+import time
+import resource
+
+from flask import g, has_app_context
+
+
+def start_timing():
+    """\
+    Start recording how long each stage of a render takes, for the rest of
+    the request
+    """
+
+    g.timings = {}
+    g.timings_start = time.perf_counter()
+    g.peak_rss = {}
+    reset_peak_rss()
+
+
+def record_timing(stage: str, seconds: float):
+    """\
+    Add time spent in a stage, if timings are being recorded; stages that run
+    more than once add up
+    """
+
+    if has_app_context() and g.get('timings') is not None:
+        g.timings[stage] = g.timings.get(stage, 0.0) + seconds
+
+
+@contextmanager
+def timed(stage: str):
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        record_timing(stage, time.perf_counter() - start)
+
+
+def get_timings() -> Optional[Dict[str, float]]:
+    """\
+    Recorded timings in milliseconds, in the order they were first recorded,
+    plus the total so far
+    """
+
+    timings = g.get('timings')
+    if timings is None:
+        return None
+    timings = dict(timings, total=time.perf_counter() - g.timings_start)
+    return {stage: round(seconds * 1000, 1) for stage, seconds in timings.items()}
+
+
+def get_server_timing() -> str:
+    """\
+    Format the recorded timings for a Server-Timing header, along with the
+    peak memory of each process
+    """
+
+    timings = get_timings()
+    if timings is None:
+        return ''
+    return ', '.join([
+        *(f'{stage};dur={ms}' for stage, ms in timings.items()),
+        *(f'rss-{process};desc="{mb} MB"' for process, mb in get_peak_rss_by_process().items()),
+    ])
+
+
+def reset_peak_rss():
+    """\
+    Reset this process's peak resident memory, so it's the peak since now
+    rather than since the process started.  Only supported on Linux,
+    elsewhere it stays the peak of the process.
+    """
+
+    try:
+        with open('/proc/self/clear_refs', 'w') as fp:
+            fp.write('5')
+    except OSError:
+        pass
+
+
+def get_peak_rss() -> float:
+    """This process's peak resident memory in MB, see reset_peak_rss"""
+    maxrss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Bytes on macOS, KB elsewhere
+    return round(maxrss / (1024 * 1024 if sys.platform == 'darwin' else 1024), 1)
+
+
+def record_peak_rss(process: str, mb: float):
+    """\
+    Record the peak memory of another process that took part in the render,
+    if timings are being recorded
+    """
+
+    if has_app_context() and g.get('peak_rss') is not None:
+        g.peak_rss[process] = max(g.peak_rss.get(process, 0.0), mb)
+
+
+def get_peak_rss_by_process() -> Dict[str, float]:
+    """\
+    Peak resident memory in MB during the render, of the app process and any
+    others that recorded theirs
+    """
+
+    return {'app': get_peak_rss(), **(g.get('peak_rss') or {})}
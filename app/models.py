@@ -1,4 +1,4 @@
-from typing import Any, Optional, Union, Dict, Tuple, Self, Literal
+from typing import Any, Optional, Union, Dict, List, Tuple, Self, Literal
 import pickle
 import hashlib
 import base64
@@ -14,7 +14,7 @@ import sqlalchemy_utils as sau
 import slugify
 
 from app import db
-from app.constants import DISPLAY_SPEC, COLOR_SPEC, DISP_STATUS, SECRET_STATUS
+from app.constants import DISPLAY_SPEC, COLOR_SPEC, IMAGE_FORMAT, DITHER, DISP_STATUS, SECRET_STATUS
 from app.lib.user import login_user
 
 
@@ -319,8 +319,9 @@ class Display(Base):
     last_seen_at = db.Column(sau.ArrowType(), nullable=False, default=arrow.utcnow)
     display_spec = db.Column(sau.ChoiceType(choices=[(k, v['name']) for k, v in DISPLAY_SPEC.items()]), nullable=False)
     color_spec = db.Column(sau.ChoiceType(choices=[(k, v['name']) for k, v in COLOR_SPEC.items()]), nullable=False)
-    image_format = db.Column(sau.ChoiceType(choices=[('BMP', 'BMP'), ('JPEG', 'JPEG'), ('PNG', 'PNG')]), nullable=False, default='BMP', server_default='BMP')
+    image_format = db.Column(sau.ChoiceType(choices=[(k, v['name']) for k, v in IMAGE_FORMAT.items()]), nullable=False, default='BMP', server_default='BMP')
     image_bit_depth = db.Column(db.Integer())
+    dither = db.Column(sau.ChoiceType(choices=[(k, v) for k, v in DITHER.items()]), nullable=False, default='floydsteinberg', server_default='floydsteinberg')
     width = db.Column(db.Integer(), nullable=False, default=0)
     height = db.Column(db.Integer(), nullable=False, default=0)
     playlist_id = db.Column(db.BigInteger().with_variant(db.Integer, "sqlite"), db.ForeignKey(Playlist.id, onupdate='CASCADE', ondelete='SET NULL', name='fk_display_playlist'))
@@ -344,6 +345,39 @@ class Display(Base):
         if current_app.config['ENABLE_DISPLAY_APPROVAL']:
             return str(random.randint(100000, 999999))
 
+    @staticmethod
+    def image_format_fits(image_format: str, color_spec: str, bit_depth: Optional[int]=None) -> bool:
+        """\
+        Determine if frames for a color spec (and bit depth) can be sent in an
+        image format; the raw palette formats need a palette with no more
+        colors than their bits per pixel can index
+        """
+
+        bits = IMAGE_FORMAT.get(image_format, {}).get('bits')
+        # From the edit form or request arguments
+        bit_depth = int(bit_depth) if str(bit_depth).isdigit() else None
+        if bits not in (2, 4) or bit_depth == 1:
+            return True
+        if bit_depth and bit_depth >= 16:
+            return False
+        palette = COLOR_SPEC.get(color_spec, {}).get('palette')
+        return bool(palette) and len(palette) <= 2 ** bits
+
+    @classmethod
+    def get_fitting_image_format(cls, image_format: str, color_spec: str, bit_depth: Optional[int]=None) -> str:
+        """\
+        The image format to use for a color spec: the one asked for if it fits
+        (see image_format_fits), otherwise the next larger raw format that does
+        """
+
+        if cls.image_format_fits(image_format, color_spec, bit_depth):
+            return image_format
+        bits = IMAGE_FORMAT[image_format]['bits']
+        return next(
+            k for k, v in sorted(IMAGE_FORMAT.items(), key=lambda i: i[1].get('bits') or 0)
+            if (v.get('bits') or 0) > bits and cls.image_format_fits(k, color_spec, bit_depth)
+        )
+
     @classmethod
     def sync(cls):
         key = request.args.get('k')
@@ -361,6 +395,7 @@ class Display(Base):
                 'height': request.args.get('h'),
                 'display_secret': secret,
             }
+            dither = request.args.get('dt', 'floydsteinberg')
             create_params = dict(update_params)
             create_params.update({
                 'key': key,
@@ -370,18 +405,41 @@ class Display(Base):
                 # Set image details on create only; this allows for editing later
                 'image_format': request.args.get('i', 'BMP'),
                 'image_bit_depth': request.args.get('ib'),
+                # An unknown choice would be stored as is, and fail every load after
+                'dither': dither if dither in DITHER else 'floydsteinberg',
             })
             display = cls.query.filter(cls.key == key).first()
             if display:
                 for k, v in update_params.items():
                     setattr(display, k, v)
+                # The color spec may have changed to one the image format can't hold
+                image_format = cls.get_fitting_image_format(display.image_format.code, update_params['color_spec'], display.image_bit_depth)
+                if image_format != display.image_format.code:
+                    display.image_format = image_format
             else:
+                create_params['image_format'] = cls.get_fitting_image_format(create_params['image_format'], create_params['color_spec'], create_params['image_bit_depth'])
                 display = cls(**create_params)
                 db.session.add(display)
             db.session.commit()
             return display
 
-    def get_playlist_screen(self, playlist_id: Optional[int]=None, playlist_screen_id: Optional[int]=None) -> Tuple[Optional[Playlist], Optional[PlaylistScreen]]:
+    def _get_next_playlist_screen_id(self, pls_ids: List[int]) -> int:
+        if self.last_playlist_screen_id:
+            # TODO: time-based
+            try:
+                idx = pls_ids.index(self.last_playlist_screen_id)
+                return pls_ids[(idx + 1) % len(pls_ids)]
+            except (ValueError, IndexError):
+                pass
+        return pls_ids[0]
+
+    def get_playlist_screen(self, playlist_id: Optional[int]=None, playlist_screen_id: Optional[int]=None, advance: bool=True) -> Tuple[Optional[Playlist], Optional[PlaylistScreen]]:
+        """\
+        Get the playlist screen to display.  Unless a specific playlist screen is
+        requested this is the next one in the rotation, and the display's
+        position in the playlist is moved to it unless advance is False.
+        """
+
         if playlist_id:
             playlist = Playlist.query.get(playlist_id)
         else:
@@ -392,22 +450,37 @@ class Display(Base):
 
         pls_by_id = {pls.id: pls for pls in playlist.playlist_screens}
         if not playlist_screen_id and pls_by_id:
-            pls_ids = list(pls_by_id.keys())
-            if self.last_playlist_screen_id:
-                # TODO: time-based
-                try:
-                    idx = pls_ids.index(self.last_playlist_screen_id)
-                    playlist_screen_id = self.last_playlist_screen_id = pls_ids[(idx + 1) % len(pls_ids)]
-                except (ValueError, IndexError):
-                    playlist_screen_id = self.last_playlist_screen_id = pls_ids[0]
-            else:
-                playlist_screen_id = self.last_playlist_screen_id = pls_ids[0]
-            db.session.commit()
+            playlist_screen_id = self._get_next_playlist_screen_id(list(pls_by_id.keys()))
+            if advance:
+                self.last_playlist_screen_id = playlist_screen_id
+                db.session.commit()
 
         playlist_screen = pls_by_id.get(playlist_screen_id)
 
         return playlist, playlist_screen
 
+    def rewind_playlist(self, playlist_screen: PlaylistScreen):
+        """\
+        Move the display's position in its playlist back so that
+        playlist_screen is the next one in the rotation again
+        """
+
+        pls_ids = [pls.id for pls in self.playlist.playlist_screens]
+        if playlist_screen.id in pls_ids:
+            self.last_playlist_screen_id = pls_ids[pls_ids.index(playlist_screen.id) - 1]
+            db.session.commit()
+
+    def get_next_poll_at(self) -> Optional[arrow.Arrow]:
+        """\
+        Estimate when the display will poll again from the refresh interval of
+        the playlist screen it was last sent
+        """
+
+        pls = self.last_playlist_screen
+        if not (self.playlist and pls):
+            return None
+        return self.last_seen_at.shift(seconds=pls.refresh_interval or self.playlist.default_refresh_interval)
+
     def get_context(self):
         return {
             'display_spec': self.display_spec,
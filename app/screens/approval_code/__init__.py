@@ -1,4 +1,7 @@
+from PIL import Image
+
 from app.lib.screen import Screen
+from app.lib.raster import draw_text_blocks
 
 from .view import bp
 
@@ -10,3 +13,18 @@ class ApprovalCode(Screen):
     blueprint = bp
     route = 'fruitstand_approvalcode.render'
     _is_system = True
+
+    def raster(self):
+        im = Image.new('RGB', (self.display.width, self.display.height), (255, 255, 255))
+        # Same breakpoints as the template
+        blocks = []
+        if im.width >= 240:
+            blocks.append(("Display Setup", 24, True))
+        if im.width >= 480:
+            blocks.append(("This display must be approved before it is used, verify that the code displayed here matches the one displayed in the screen list", 16, False))
+        blocks += [
+            ("Code:", 16, True),
+            (self.display.approval_code, 32, True),
+        ]
+        draw_text_blocks(im, blocks)
+        return im
@@ -1,4 +1,7 @@
+from PIL import Image
+
 from app.lib.screen import Screen
+from app.lib.raster import draw_text_blocks
 
 from .view import bp
 
@@ -10,3 +13,13 @@ class Error(Screen):
     blueprint = bp
     route = 'fruitstand_error.render'
     _is_system = True
+
+    def raster(self):
+        error = self.context.get('extra', {}).get('error') or {}
+        im = Image.new('RGB', (self.display.width, self.display.height), (255, 255, 255))
+        # Same breakpoints as the template
+        blocks = [(error.get('title', "Error"), 32 if im.width >= 240 else 16, True)]
+        if im.width >= 480:
+            blocks.append((error.get('message', "Unknown Error"), 16, False))
+        draw_text_blocks(im, blocks)
+        return im
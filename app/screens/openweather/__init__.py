@@ -15,6 +15,10 @@ class OpenWeather(Screen):
     blueprint = bp
     route = 'fruitstand_openweather.render'
     config_form = OpenWeatherConfigForm
+    # The graph is sized once when the page loads
+    resizable = False
+    # The graph is updated from the new data when the page is reused
+    warm_reuse = True
     default_config = {
         'appid': None,
         'lat': None,
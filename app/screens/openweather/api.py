@@ -5,6 +5,7 @@ import arrow
 
 from app import cache
 from app.lib.cache import make_key_with_args
+from app.lib.render import get_upstream_timeout
 
 
 class OpenWeatherAPI:
@@ -27,7 +28,7 @@ class OpenWeatherAPI:
         url = self._build_base_url(api)
         params = dict({'appid': self.appid}, **kwargs)
         def _fetch(url, params):
-            res = requests.get(url, params=params)
+            res = requests.get(url, params=params, timeout=get_upstream_timeout())
             res.raise_for_status()
             return res.json()
         return cache.get_or_fetch(f'openweather-api-{api}', 600, _fetch, url, params)
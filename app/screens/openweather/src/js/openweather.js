@@ -1,6 +1,12 @@
 import Chart from 'chart.js/auto'
 
+// The data is in the page content rather than a script, so it's replaced
+// along with the rest of the content when the page is updated
+const getGraphData = () => JSON.parse(document.getElementById('graph-data-json').textContent);
+
 (async function() {
+  // Don't take the screenshot until the graph is drawn
+  window.fsRender.hold();
 
   const bgPattern = function() {
     let shape = document.createElement('canvas');
@@ -43,7 +49,8 @@ import Chart from 'chart.js/auto'
   canvas.width = parent_width;
   canvas.height = parent_height;
 
-  new Chart(
+  const graph_data = getGraphData();
+  const chart = new Chart(
     canvas,
     {
       type: 'bar',
@@ -109,12 +116,12 @@ import Chart from 'chart.js/auto'
         }
       },
       data: {
-        labels: window.graph_data.map(row => row.label),
+        labels: graph_data.map(row => row.label),
         datasets: [
           {
             type: 'line',
             label: 'Temperature',
-            data: window.graph_data.map(row => row.temp),
+            data: graph_data.map(row => row.temp),
             yAxisID: 'yTemp',
             pointStyle: false,
             borderColor: js_color('.openweather.graph.temperature', 'color'),
@@ -124,7 +131,7 @@ import Chart from 'chart.js/auto'
           {
             type: 'bar',
             label: 'Precipitation',
-            data: window.graph_data.map(row => row.precip * 100),
+            data: graph_data.map(row => row.precip * 100),
             yAxisID: 'yPercent',
             backgroundColor: js_color('.openweather.graph.precipitation', 'color', bgPattern()),
             order: 2,
@@ -132,7 +139,7 @@ import Chart from 'chart.js/auto'
           {
             type: 'line',
             label: 'Humidity',
-            data: window.graph_data.map(row => row.humid * 100),
+            data: graph_data.map(row => row.humid * 100),
             yAxisID: 'yPercent',
             showLine: false,
             pointBackgroundColor: js_color('.openweather.graph.humidity', 'background-color', '#fff'),
@@ -143,4 +150,16 @@ import Chart from 'chart.js/auto'
       }
     }
   );
+
+  // Redraw with the new data when the renderer updates the page
+  document.addEventListener('fruitstand:update', () => {
+    const graph_data = getGraphData();
+    chart.data.labels = graph_data.map(row => row.label);
+    chart.data.datasets[0].data = graph_data.map(row => row.temp);
+    chart.data.datasets[1].data = graph_data.map(row => row.precip * 100);
+    chart.data.datasets[2].data = graph_data.map(row => row.humid * 100);
+    chart.update('none');
+  });
+
+  window.fsRender.release();
 })();
@@ -5,6 +5,7 @@ import arrow
 
 from app import cache
 from app.lib.cache import make_key_with_args
+from app.lib.render import get_upstream_timeout
 
 
 class ZenQuotesAPI:
@@ -19,7 +20,7 @@ class ZenQuotesAPI:
         if self.api_key:
             params['key'] = self.api_key
         params.update(kwargs)
-        res = requests.get(self.base_url, params=params)
+        res = requests.get(self.base_url, params=params, timeout=get_upstream_timeout())
         res.raise_for_status()
         return res.json()
 
@@ -1,19 +1,26 @@
-document.querySelectorAll('img.inline-svg').forEach(el => {
-    fetch(el.src).then(r => {
-        r.text().then(c => {
-            const doc = (new DOMParser()).parseFromString(c, 'text/xml');
-            const svg = doc.querySelector('svg');
-            svg.id = el.id || svg.id
-            // svg.classList = el.classList || svg.classList;
-            el.classList.forEach(cl => svg.classList.add(cl));
-            // need to remove "xmlns:a" attr?
-            // width/height are not useful
-            svg.setAttribute('width', '');
-            svg.setAttribute('height', '');
-            el.replaceWith(svg);
-        });
+// Replace img.inline-svg with the SVG itself, so it can be styled with CSS
+function inline_svgs() {
+    document.querySelectorAll('img.inline-svg').forEach(el => {
+        fsRender.hold();
+        fetch(el.src).then(r => {
+            return r.text().then(c => {
+                const doc = (new DOMParser()).parseFromString(c, 'text/xml');
+                const svg = doc.querySelector('svg');
+                svg.id = el.id || svg.id
+                // svg.classList = el.classList || svg.classList;
+                el.classList.forEach(cl => svg.classList.add(cl));
+                // need to remove "xmlns:a" attr?
+                // width/height are not useful
+                svg.setAttribute('width', '');
+                svg.setAttribute('height', '');
+                el.replaceWith(svg);
+            });
+        }).finally(() => fsRender.release());
     });
-});
+}
+inline_svgs();
+// New content from fsRender.update()
+document.addEventListener('fruitstand:update', inline_svgs);
 
 function js_color(selector, property, dfl) {
     const el = document.querySelector('#js_colors ' + selector);
@@ -1,84 +1,149 @@
-import os
-import tempfile
 import json
-import uuid
+import math
+import time
 import urllib.parse
-import subprocess
-from io import BytesIO
 import functools
 
-from flask import Blueprint, render_template, abort, flash, redirect, url_for, request, send_file, current_app, jsonify
-import arrow
 import requests
+from flask import Blueprint, render_template, abort, flash, redirect, url_for, request, send_file, current_app, jsonify, g
+import arrow
 
-from app import db
+from app import db, render_limiter
 from app.models import Display, Playlist, Screen, DisplaySecret
 from app.constants import DISPLAY_SPEC, COLOR_SPEC
 from app.forms import DisplayEditForm, DisplaySecretEditForm
 from app.lib.metric import Metric
 from app.lib.screen import Screen as BaseScreen
-from app.lib.image import convert_colors
+from app.lib.render import RenderError, Deadline, Frame, render_frame, get_render_time, make_delta_frame, get_frame_encoding, compress_frame, get_last_frame, set_last_frame
+from app.lib.prerender import save_render_args, pop_prerendered_frame, request_render, cancel_render
+from app.lib.limiter import RenderBusy
+from app.lib.accel import write_frame_file
+from app.lib.timing import start_timing, timed, get_timings, get_server_timing, get_peak_rss_by_process
 from app.lib.user import login_required, admin_required
 
 
 bp = Blueprint('display', __name__)
 
 
-@bp.route('/render', methods=['GET'])
-def render():
-    screen = BaseScreen.load_for_render(
-        playlist_id=int(request.args.get('debug_playlist_id', 0)) or None,
-        playlist_screen_id=int(request.args.get('debug_playlist_screen_id', 0)) or None,
+def is_async_render(screen: BaseScreen) -> bool:
+    """\
+    Whether to render in the background for this request; the display must
+    ask for it and be showing a screen from its playlist rotation
+    """
+
+    return bool(
+        request.args.get('a')
+        and not (request.args.get('debug_playlist_id') or request.args.get('debug_playlist_screen_id'))
+        and not screen.system
+        and screen.display.display_spec != 'browser'
     )
 
-    args = {
-        'playlist_screen_id': screen.playlist_screen.id if screen.playlist_screen else None,
-        'display_id': screen.display.id,
-        'metrics': json.dumps(Metric.get_metrics()),
-        '_render_display': 1,
-    }
 
-    if current_app.config.get('INTERNAL_WEB_HOST'):
-        # the _external argument doesn't work here as it uses the configured host
-        # (or host header, probably localhost) and this is not going to be valid
-        # in certain environments like Docker, so "fix" it
-        url = 'http://{}{}'.format(
-            current_app.config['INTERNAL_WEB_HOST'],
-            url_for(screen.route, **args)
+def log_render_timing(screen: BaseScreen, frame: Frame, status: int):
+    if current_app.config['RENDER_TIMING_LOG']:
+        current_app.logger.info("Render timing %s", json.dumps({
+            'display_id': screen.display.id,
+            'screen': screen.key,
+            'status': status,
+            'source': frame.source,
+            'width': screen.display.width,
+            'height': screen.display.height,
+            'format': screen.display.image_format.code,
+            'bytes': len(frame.payload),
+            'timings': get_timings(),
+            'peak_rss_mb': get_peak_rss_by_process(),
+        }))
+
+
+@bp.after_request
+def add_server_timing(res):
+    if g.get('timings') is not None:
+        res.headers['Server-Timing'] = get_server_timing()
+        g.pop('timings')
+        g.pop('peak_rss', None)
+    return res
+
+
+@bp.route('/render', methods=['GET'])
+def render():
+    start_timing()
+    with timed('load'):
+        screen = BaseScreen.load_for_render(
+            playlist_id=int(request.args.get('debug_playlist_id', 0)) or None,
+            playlist_screen_id=int(request.args.get('debug_playlist_screen_id', 0)) or None,
         )
-    else:
-        url = url_for(screen.route, **args, _external=True)
+    save_render_args(screen.display)
+
     headers = {
         'X-Refresh-Time': screen.refresh_interval,
     }
-    if screen.display.display_spec == 'browser':
-        payload = requests.get(url).content
-        headers.update({'Content-length': len(payload), 'Content-type': 'text/html'})
-    else:
-        path = os.path.join(tempfile.gettempdir(), 'fs-render-' + str(uuid.uuid4()) + '.png')
-        try:
-            subprocess.check_call([
-                'npm', 'run', 'render', '--',
-                '--url', url,
-                '--width', str(screen.display.width),
-                '--height', str(screen.display.height),
-                '--path', path,
-                '--browser', current_app.config['BROWSER'],
-            ])
-            im = convert_colors(screen.display.image_bit_depth, screen.display.color_spec, path)
-            out = BytesIO()
-            fmt = screen.display.image_format.code.lower()
-            im.save(out, fmt)
-            l = out.tell()
-            out.seek(0)
-            payload = out
-            headers.update({'Content-length': l, 'Content-type': f'image/{fmt}'})
-        finally:
-            if os.path.exists(path):
-                os.unlink(path)
-
-    # TODO: error handling - ideally render pretty error screen but worst case text/plain
-    return payload, headers
+    frame = pop_prerendered_frame(screen)
+    if not frame and is_async_render(screen):
+        # Have the scheduler render the frame and tell the display when to
+        # come back for it, rather than holding this worker for the render
+        requested_at = request_render(screen)
+        if time.time() - requested_at < current_app.config['RENDER_ASYNC_TIMEOUT']:
+            screen.display.rewind_playlist(screen.playlist_screen)
+            retry_after = math.ceil(get_render_time() + current_app.config['PRERENDER_INTERVAL'])
+            return '', 202, {
+                'Retry-After': retry_after,
+                'X-Refresh-Time': retry_after,
+            }
+        current_app.logger.warning("Frame for display %s wasn't rendered in time, is the prerender scheduler running?", screen.display.id)
+        cancel_render(screen.display)
+
+    try:
+        frame = frame or render_frame(screen, Deadline(current_app.config['RENDER_DEADLINE']))
+    except (RenderError, RenderBusy, requests.RequestException) as e:
+        current_app.logger.warning("Failed to render display %s: %s", screen.display.id, e)
+        retry_after = getattr(e, 'retry_after', current_app.config['RENDER_RETRY_AFTER'])
+        frame = get_last_frame(screen.display)
+        if not frame:
+            return str(e), 503, {
+                'Content-type': 'text/plain',
+                'Retry-After': retry_after,
+                'X-Refresh-Time': retry_after,
+            }
+        # Keep showing the last good frame, and try again sooner than usual
+        frame.source = 'fallback'
+        headers['X-Refresh-Time'] = retry_after
+
+    if frame.is_current(request.args.get('e'), request.if_none_match):
+        # Display already has this frame, it doesn't need to download or redraw it
+        headers['ETag'] = frame.get_headers()['ETag']
+        log_render_timing(screen, frame, 304)
+        return '', 304, headers
+
+    prev_frame = get_last_frame(screen.display)
+    set_last_frame(screen.display, frame)
+    if request.args.get('d') and prev_frame and prev_frame.is_current(request.args.get('e'), request.if_none_match):
+        # Display supports partial refresh and has the previous frame, send only what changed
+        with timed('delta'):
+            frame = make_delta_frame(prev_frame, frame, screen.display.image_format.code) or frame
+    # Compressed if the display asks for it
+    encoding = get_frame_encoding(request.args.get('z'), request.accept_encodings)
+    if encoding:
+        with timed('compress'):
+            frame = compress_frame(frame, encoding)
+    headers['Vary'] = 'Accept-Encoding'
+    headers.update(frame.get_headers())
+
+    if current_app.config['FRAME_ACCEL_DIR']:
+        # Have nginx send the frame from disk, rather than tying up this worker
+        with timed('write'):
+            headers['X-Accel-Redirect'] = write_frame_file(frame.payload)
+        del headers['Content-length']
+        log_render_timing(screen, frame, 200)
+        return '', headers
+
+    log_render_timing(screen, frame, 200)
+    return frame.payload, headers
+
+
+@bp.route('/render/stats', methods=['GET'])
+@login_required
+def render_stats():
+    return jsonify(render_limiter.get_stats())
 
 
 @bp.route('/', methods=['GET'])
@@ -0,0 +1,256 @@
+import puppeteer from 'puppeteer';
+import fs from 'fs';
+import path from 'path';
+
+export function getBrowserConfig(browser) {
+  const browserConfig = {browser: browser};
+
+  if (browser == 'firefox') {
+    browserConfig.extraPrefsFirefox = {
+      'gfx.text.disable-aa': true,
+      'gfx.font_rendering.cleartype_params.cleartype_level': 0,
+      'gfx.font_rendering.cleartype_params.pixel_structure': 0,
+      'gfx.font_rendering.cleartype_params.rendering_mode': 1,
+    };
+  }
+
+  if (browser == 'chrome') {
+    browserConfig.args = [
+      '--no-sandbox',
+      '--disable-gpu'
+    ];
+  }
+
+  return browserConfig;
+}
+
+export async function launchBrowser(browser) {
+  return await puppeteer.launch(getBrowserConfig(browser));
+}
+
+export async function readStdin() {
+  const chunks = [];
+  for await (const chunk of process.stdin) {
+    chunks.push(chunk);
+  }
+  return Buffer.concat(chunks).toString('utf8');
+}
+
+const contentTypes = {
+  '.css': 'text/css',
+  '.js': 'text/javascript',
+  '.json': 'application/json',
+  '.map': 'application/json',
+  '.svg': 'image/svg+xml',
+  '.png': 'image/png',
+  '.jpg': 'image/jpeg',
+  '.jpeg': 'image/jpeg',
+  '.gif': 'image/gif',
+  '.ico': 'image/x-icon',
+  '.woff': 'font/woff',
+  '.woff2': 'font/woff2',
+  '.ttf': 'font/ttf',
+  '.eot': 'application/vnd.ms-fontobject',
+  '.html': 'text/html; charset=utf-8',
+};
+
+// Static files by path, kept as long as the process runs (the render
+// service) and reloaded when they change on disk
+const staticCache = new Map();
+
+function readStatic(file) {
+  const stat = fs.statSync(file, {throwIfNoEntry: false});
+  if (!stat || !stat.isFile()) {
+    return null;
+  }
+  let entry = staticCache.get(file);
+  if (!entry || entry.mtimeMs != stat.mtimeMs) {
+    entry = {
+      mtimeMs: stat.mtimeMs,
+      body: fs.readFileSync(file),
+      contentType: contentTypes[path.extname(file).toLowerCase()] || 'application/octet-stream',
+    };
+    staticCache.set(file, entry);
+  }
+  return entry;
+}
+
+// Find the file for a static URL from job.static, a map of URL path prefixes
+// to directories, or null if it isn't one
+function findStatic(job, url) {
+  const pageUrl = new URL(job.url);
+  url = new URL(url);
+  if (!job.static || url.origin != pageUrl.origin) {
+    return null;
+  }
+  // Longest prefix first, static dirs may be mounted inside one another
+  const prefixes = Object.keys(job.static).sort((a, b) => b.length - a.length);
+  for (const prefix of prefixes) {
+    if (url.pathname.startsWith(prefix)) {
+      const dir = path.resolve(job.static[prefix]);
+      const file = path.resolve(dir, decodeURIComponent(url.pathname.slice(prefix.length)));
+      // Don't serve anything outside of the static dir
+      return file.startsWith(dir + path.sep) ? file : null;
+    }
+  }
+  return null;
+}
+
+// When the job includes the page HTML, answer the navigation to job.url with
+// it instead of fetching it from the server, and load static files from disk;
+// everything else loads normally
+function interceptRequests(page, job) {
+  let htmlServed = false;
+  return req => {
+    if (req.isInterceptResolutionHandled()) {
+      return;
+    }
+    // Match on the navigation rather than the URL, which the browser may normalize
+    if (job.html != null && !htmlServed && req.isNavigationRequest() && req.frame() === page.mainFrame()) {
+      htmlServed = true;
+      req.respond({
+        status: 200,
+        contentType: 'text/html; charset=utf-8',
+        body: job.html,
+      });
+      return;
+    }
+
+    let entry = null;
+    if (req.method() == 'GET') {
+      try {
+        const file = findStatic(job, req.url());
+        entry = file && readStatic(file);
+      } catch (e) {
+        console.error(`Failed to load static file for ${req.url()}:`, e.message);
+      }
+    }
+    if (entry) {
+      req.respond({
+        status: 200,
+        contentType: entry.contentType,
+        body: entry.body,
+      });
+    } else {
+      // Not a static file, or missing; let the server handle it
+      req.continue();
+    }
+  };
+}
+
+// job.timeout bounds the whole job, from when it's given to renderPage or
+// updatePage (or earlier, if the caller already set job.deadline)
+function withDeadline(job) {
+  if (job.deadline == null && job.timeout) {
+    return {...job, deadline: Date.now() + parseInt(job.timeout)};
+  }
+  return job;
+}
+
+// Milliseconds left until the job's deadline, at most max; undefined for no
+// limit.  Never 0, which puppeteer takes as no timeout at all.
+function timeLeft(job, max) {
+  if (job.deadline == null) {
+    return max;
+  }
+  const left = job.deadline - Date.now();
+  if (left <= 0) {
+    throw new Error(`Render timed out after ${job.timeout}ms`);
+  }
+  return max === undefined ? left : Math.min(left, max);
+}
+
+// Wait for the page to say it's ready to be captured (see fsRender in the
+// screen base template), falling back to waiting for the network to go quiet
+// for pages that don't or that take too long
+async function waitForReady(page, job) {
+  const readyTimeout = job.readyTimeout ? parseInt(job.readyTimeout) : 10000;
+  if (await page.evaluate(() => window.fsRender !== undefined)) {
+    const timeout = timeLeft(job, readyTimeout);
+    try {
+      await page.waitForFunction(() => window.fsRender.ready, {timeout: timeout});
+      return;
+    } catch (e) {
+      if (e.name != 'TimeoutError') {
+        throw e;
+      }
+      console.error(`Page not ready after ${timeout}ms, waiting for the network to be idle`);
+    }
+  }
+  await page.waitForNetworkIdle({idleTime: 500, concurrency: 2, timeout: timeLeft(job, readyTimeout)});
+}
+
+async function setViewport(page, viewport) {
+  await page.setViewport({
+      width: parseInt(viewport.width),
+      height: parseInt(viewport.height),
+      deviceScaleFactor: 1,
+      isMobile: true,
+  });
+}
+
+// Run fn with requests from the page intercepted (see interceptRequests)
+async function withInterception(page, job, fn) {
+  const handler = interceptRequests(page, job);
+  await page.setRequestInterception(true);
+  page.on('request', handler);
+  try {
+    await fn();
+  } finally {
+    page.off('request', handler);
+    await page.setRequestInterception(false);
+  }
+}
+
+// Take a screenshot at each of job.viewports, resizing the page between them
+async function captureViewports(page, job) {
+  const screenshots = [];
+  for (const [i, viewport] of job.viewports.entries()) {
+    // Throws once the deadline has passed
+    timeLeft(job);
+    if (i > 0) {
+      await setViewport(page, viewport);
+      // Give the page a couple of frames to lay itself out at the new size
+      await page.evaluate(() => new Promise(resolve => requestAnimationFrame(() => requestAnimationFrame(resolve))));
+    }
+    // PNG is lossless, and optimizeForSpeed trades a little size for much faster encoding
+    screenshots.push(await page.screenshot({type: 'png', optimizeForSpeed: true}));
+  }
+  return screenshots;
+}
+
+function getViewports(job) {
+  return job.viewports || [{width: job.width, height: job.height}];
+}
+
+// Load the page and take a screenshot at each of the job's viewports
+export async function renderPage(page, job) {
+  job = withDeadline({...job, viewports: getViewports(job)});
+  await setViewport(page, job.viewports[0]);
+  await withInterception(page, job, async () => {
+    await page.goto(job.url, {waitUntil: 'load', timeout: timeLeft(job)});
+    await waitForReady(page, job);
+  });
+  return await captureViewports(page, job);
+}
+
+// Update a page already showing the same screen with the job's HTML (see
+// fsRender.update in the screen base template), rather than loading it again
+export async function updatePage(page, job) {
+  job = withDeadline({...job, viewports: getViewports(job)});
+  await setViewport(page, job.viewports[0]);
+  // There's no navigation, only new static files to load
+  await withInterception(page, {...job, html: null}, async () => {
+    if (!await page.evaluate(html => {
+      if (typeof window.fsRender?.update != 'function') {
+        return false;
+      }
+      window.fsRender.update(html);
+      return true;
+    }, job.html)) {
+      throw new Error("Page doesn't support updates");
+    }
+    await waitForReady(page, job);
+  });
+  return await captureViewports(page, job);
+}
@@ -0,0 +1,295 @@
+import { createRequire } from "module";
+const require = createRequire(import.meta.url);
+
+const {program} = require('commander');
+import net from 'net';
+import fs from 'fs';
+import { launchBrowser, renderPage, updatePage } from './render-common.js';
+
+program
+  .version('1.0.0', '-v, --version')
+  .usage('[OPTIONS]...')
+  .option('-s, --socket <socket>', "Unix socket path or host:port to listen on")
+  .option('-b, --browser <browser>', "Browser to use (firefox or chrome, must be installed with `npx puppeteer browsers install <browser>`)")
+  .option('-n, --pool-size <size>', "Number of browser instances to keep running", '2')
+  .option('-r, --recycle-after <renders>', "Restart each browser after this many renders", '100')
+  .option('-w, --warm-pages <pages>', "Number of pages each browser keeps loaded for jobs with a warm key, 0 to disable", '4')
+  .option('-q, --queue-size <jobs>', "Number of jobs that can wait for a browser, further jobs are turned away; 0 for no limit", '20')
+  .parse(process.argv);
+
+const options = program.opts();
+const poolSize = Math.max(1, parseInt(options.poolSize));
+const recycleAfter = Math.max(1, parseInt(options.recycleAfter));
+const warmPages = Math.max(0, parseInt(options.warmPages));
+const queueSize = Math.max(0, parseInt(options.queueSize));
+
+function log(...args) {
+  console.error('[render-server]', ...args);
+}
+
+// Settle with the promise, or reject as soon as the signal is aborted; the
+// promise is left to settle on its own
+function abortable(promise, signal) {
+  return new Promise((resolve, reject) => {
+    const onAbort = () => reject(signal.reason);
+    signal.addEventListener('abort', onAbort, {once: true});
+    promise.then(resolve, reject).finally(() => signal.removeEventListener('abort', onAbort));
+  });
+}
+
+
+class Worker {
+  constructor(id) {
+    this.id = id;
+    this.browser = null;
+    this.page = null;
+    this.renders = 0;
+    // Pages kept loaded by job.warm, least recently used first
+    this.warm = new Map();
+    // A render given up on, still running until its browser is closed
+    this.abandoned = null;
+  }
+
+  async ensure() {
+    if (this.browser && !this.browser.connected) {
+      log(`worker ${this.id}: browser disconnected`);
+      this.browser = this.page = null;
+    }
+    if (!this.browser) {
+      this.browser = await launchBrowser(options.browser);
+      this.page = await this.browser.newPage();
+      this.renders = 0;
+      this.warm.clear();
+    }
+    if (this.page.isClosed()) {
+      this.page = await this.browser.newPage();
+    }
+  }
+
+  async recycle() {
+    const browser = this.browser;
+    this.browser = this.page = null;
+    this.warm.clear();
+    if (browser) {
+      await browser.close().catch(e => log(`worker ${this.id}: error closing browser:`, e.message));
+    }
+  }
+
+  // Render in the page kept for the job's warm key, updating it if it's
+  // already loaded
+  async runWarm(job) {
+    let page = this.warm.get(job.warm);
+    this.warm.delete(job.warm);
+    if (page && !page.isClosed()) {
+      this.warm.set(job.warm, page);
+      try {
+        return await updatePage(page, job);
+      } catch (e) {
+        log(`worker ${this.id}: failed to update page, loading it again:`, e.message);
+      }
+    } else {
+      page = await this.browser.newPage();
+      this.warm.set(job.warm, page);
+      if (this.warm.size > warmPages) {
+        const [key, oldest] = this.warm.entries().next().value;
+        this.warm.delete(key);
+        await oldest.close().catch(e => log(`worker ${this.id}: error closing page:`, e.message));
+      }
+    }
+    return await renderPage(page, job);
+  }
+
+  async render(job) {
+    await this.ensure();
+    if (job.warm && job.html != null && warmPages) {
+      return await this.runWarm(job);
+    }
+    return await renderPage(this.page, job);
+  }
+
+  // Render the job, giving up on it when the signal is aborted
+  async run(job, signal) {
+    const render = this.render(job);
+    let data;
+    try {
+      data = await abortable(render, signal);
+    } catch (e) {
+      if (signal.aborted) {
+        this.abandoned = render.catch(() => {});
+      }
+      // The page may be in any state after a failure, start over with a fresh browser
+      this.renders = recycleAfter;
+      throw e;
+    }
+    this.renders++;
+    return data;
+  }
+
+  async maintain() {
+    if (this.renders >= recycleAfter) {
+      log(`worker ${this.id}: recycling browser after ${this.renders} renders`);
+      await this.recycle();
+    }
+    if (this.abandoned) {
+      // Closing the browser ends it
+      await this.abandoned;
+      this.abandoned = null;
+    }
+    await this.ensure();
+  }
+}
+
+
+class Pool {
+  constructor(size) {
+    this.idle = [];
+    this.waiting = [];
+    for (let i = 0; i < size; i++) {
+      this.idle.push(new Worker(i));
+    }
+    this.workers = [...this.idle];
+  }
+
+  acquire(job, signal) {
+    // Prefer a worker that has the job's page loaded already
+    const i = job.warm ? this.idle.findIndex(w => w.warm.has(job.warm)) : -1;
+    const [worker] = this.idle.splice(Math.max(i, 0), 1);
+    if (worker) {
+      return Promise.resolve(worker);
+    }
+    if (queueSize && this.waiting.length >= queueSize) {
+      return Promise.reject(new Error(`Render service busy, ${this.waiting.length} jobs already waiting`));
+    }
+    return new Promise((resolve, reject) => {
+      const onAbort = () => {
+        this.waiting.splice(this.waiting.indexOf(next), 1);
+        reject(signal.reason);
+      };
+      const next = worker => {
+        signal.removeEventListener('abort', onAbort);
+        resolve(worker);
+      };
+      signal.addEventListener('abort', onAbort, {once: true});
+      this.waiting.push(next);
+    });
+  }
+
+  release(worker) {
+    const next = this.waiting.shift();
+    if (next) {
+      next(worker);
+    } else {
+      this.idle.push(worker);
+    }
+  }
+
+  async run(job, signal) {
+    signal.throwIfAborted();
+    const worker = await this.acquire(job, signal);
+    try {
+      return await worker.run(job, signal);
+    } finally {
+      // Recycling/relaunching happens after the response is sent so the next job gets a warm browser
+      worker.maintain()
+        .catch(e => log(`worker ${worker.id}: error starting browser:`, e.message))
+        .finally(() => this.release(worker));
+    }
+  }
+
+  async warm() {
+    await Promise.all(this.workers.map(w => w.ensure()));
+  }
+
+  async close() {
+    await Promise.all(this.workers.map(w => w.recycle()));
+  }
+}
+
+
+const pool = new Pool(poolSize);
+
+function handleConnection(socket) {
+  let buffer = '';
+  // Jobs still running for this connection, aborted if the app goes away
+  const running = new Set();
+  socket.setEncoding('utf8');
+  socket.on('error', e => log('connection error:', e.message));
+  socket.on('close', () => {
+    for (const controller of running) {
+      controller.abort(new Error("Connection closed"));
+    }
+  });
+  socket.on('data', chunk => {
+    buffer += chunk;
+    let idx;
+    while ((idx = buffer.indexOf('\n')) >= 0) {
+      const line = buffer.slice(0, idx);
+      buffer = buffer.slice(idx + 1);
+      if (!line.trim()) {
+        continue;
+      }
+
+      let job;
+      try {
+        job = JSON.parse(line);
+      } catch (e) {
+        socket.write(JSON.stringify({ok: false, error: `Invalid job: ${e.message}`}) + '\n');
+        continue;
+      }
+
+      // job.timeout bounds the whole job, waiting for a browser included
+      const controller = new AbortController();
+      const timeout = job.timeout ? parseInt(job.timeout) : 0;
+      let timer = null;
+      if (timeout) {
+        job.deadline = Date.now() + timeout;
+        timer = setTimeout(() => controller.abort(new Error(`Render timed out after ${timeout}ms`)), timeout);
+      }
+      running.add(controller);
+
+      // Successful responses are followed by the screenshots, one per viewport,
+      // each `lengths[i]` bytes of PNG data
+      pool.run(job, controller.signal).then(
+        screenshots => {
+          if (socket.writable) {
+            socket.write(JSON.stringify({id: job.id, ok: true, lengths: screenshots.map(s => s.length)}) + '\n');
+            for (const data of screenshots) {
+              socket.write(data);
+            }
+          }
+        },
+        e => {
+          if (socket.writable) {
+            socket.write(JSON.stringify({id: job.id, ok: false, error: e.message}) + '\n');
+          }
+        },
+      ).finally(() => {
+        clearTimeout(timer);
+        running.delete(controller);
+      });
+    }
+  });
+}
+
+const server = net.createServer(handleConnection);
+const hostPort = options.socket.match(/^(.*):(\d+)$/);
+
+async function shutdown() {
+  log('shutting down');
+  server.close();
+  await pool.close();
+  process.exit(0);
+}
+process.on('SIGTERM', shutdown);
+process.on('SIGINT', shutdown);
+
+await pool.warm();
+if (hostPort) {
+  server.listen(parseInt(hostPort[2]), hostPort[1] || '127.0.0.1');
+} else {
+  if (fs.existsSync(options.socket)) {
+    fs.unlinkSync(options.socket);
+  }
+  server.listen(options.socket);
+}
+log(`listening on ${options.socket} with ${poolSize} browser(s), recycling after ${recycleAfter} renders, keeping ${warmPages} warm page(s) each, queueing up to ${queueSize || 'any number of'} job(s)`);
@@ -2,7 +2,8 @@ import { createRequire } from "module";
 const require = createRequire(import.meta.url);
 
 const {program} = require('commander');
-import puppeteer from 'puppeteer';
+import fs from 'fs';
+import { launchBrowser, readStdin, renderPage } from './render-common.js';
 
 program
   .version('1.0.0', '-v, --version')
@@ -10,38 +11,28 @@ program
   .option('-u, --url <url>', "URL to render")
   .option('-w, --width <width>', "Width of the viewport")
   .option('-h, --height <height>', "Height of the viewport")
-  .option('-p, --path <path>', "Path to save the file to")
+  .option('-p, --path <path>', "Path to save the file to, the screenshot is written to stdout if not given")
   .option('-b, --browser <browser>', "Browser to use (firefox or chrome, must be installed with `npx puppeteer browsers install <browser>`)")
+  .option('-t, --timeout <ms>', "Give up if the page hasn't loaded after this many milliseconds")
+  .option('--ready-timeout <ms>', "Maximum time to wait for the page to be ready after it loads")
+  .option('--static-map <json>', "JSON object mapping static URL path prefixes to the directories to load them from")
+  .option('--stdin-html', "Read the page HTML from stdin instead of fetching the URL")
   .parse(process.argv);
 
 const options = program.opts();
-
-const browserConfig = {browser: options.browser}
-
-if (options.browser == 'firefox') {
-  browserConfig.extraPrefsFirefox = {
-    'gfx.text.disable-aa': true,
-    'gfx.font_rendering.cleartype_params.cleartype_level': 0,
-    'gfx.font_rendering.cleartype_params.pixel_structure': 0,
-    'gfx.font_rendering.cleartype_params.rendering_mode': 1,
-  };
+if (options.staticMap) {
+  options.static = JSON.parse(options.staticMap);
 }
-
-if (options.browser == 'chrome') {
-  browserConfig.args = [
-    '--no-sandbox',
-    '--disable-gpu'
-  ];
+if (options.stdinHtml) {
+  options.html = await readStdin();
 }
 
-const browser = await puppeteer.launch(browserConfig);
+const browser = await launchBrowser(options.browser);
 const page = await browser.newPage();
-await page.setViewport({
-    width: parseInt(options.width),
-    height: parseInt(options.height),
-    deviceScaleFactor: 1,
-    isMobile: true,
-});
-await page.goto(options.url, {waitUntil: 'networkidle2'});
-await page.screenshot({path: options.path});
+const [data] = await renderPage(page, options);
 await browser.close();
+if (options.path) {
+  fs.writeFileSync(options.path, data);
+} else {
+  process.stdout.write(data);
+}
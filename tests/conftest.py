@@ -0,0 +1,17 @@
+import pytest
+
+from app import create_app, db
+
+
+@pytest.fixture(scope='session')
+def app(tmp_path_factory):
+    tmp = tmp_path_factory.mktemp('fruitstand')
+    (tmp / 'cache').mkdir()
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setenv('FRUITSTAND_SECRET_KEY', 'test')
+        mp.setenv('FRUITSTAND_SQLALCHEMY_DATABASE_URI', f'sqlite:///{tmp / "fruitstand.db"}')
+        mp.setenv('FRUITSTAND_FILESYSTEM_CACHE_DIR', str(tmp / 'cache'))
+        app = create_app()
+    with app.app_context():
+        db.create_all()
+        yield app
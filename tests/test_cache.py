@@ -0,0 +1,58 @@
+import os
+
+import pytest
+
+from app.lib import cache as cache_module
+from app.lib.cache import FilesystemDriver
+
+
+class App:
+    def __init__(self, cache_dir):
+        self.config = {'FILESYSTEM_CACHE_DIR': str(cache_dir)}
+
+
+@pytest.fixture
+def driver(tmp_path):
+    return FilesystemDriver(App(tmp_path))
+
+
+def test_set_and_get(driver, tmp_path):
+    assert driver.set('key', 60, {'a': 1})
+    assert driver.get('key') == {'a': 1}
+    # Nothing left behind but the entry itself
+    assert os.listdir(tmp_path) == [os.path.basename(driver._get_path('key'))]
+
+
+def test_expired(driver):
+    driver.set('key', -1, 'data')
+    assert driver.get('key') is None
+    assert not os.path.exists(driver._get_path('key'))
+
+
+def test_corrupt_entry_removed_by_another_process(driver, monkeypatch):
+    filename = driver._get_path('key')
+    with open(filename, 'wb') as fp:
+        fp.write(b'not a pickle')
+
+    unlink = os.unlink
+
+    def unlink_after_other_process(path):
+        unlink(path)
+        unlink(path)
+    monkeypatch.setattr(cache_module.os, 'unlink', unlink_after_other_process)
+
+    assert driver.get('key') is None
+
+
+def test_failed_write_leaves_entry(driver, tmp_path):
+    driver.set('key', 60, 'old')
+    with pytest.raises(Exception):
+        driver.set('key', 60, lambda: None)
+    assert driver.get('key') == 'old'
+    assert len(os.listdir(tmp_path)) == 1
+
+
+def test_delete(driver):
+    driver.set('key', 60, 'data')
+    assert driver.delete('key')
+    assert not driver.delete('key')
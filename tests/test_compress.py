@@ -0,0 +1,60 @@
+import numpy as np
+import pytest
+
+from app.lib.compress import packbits
+
+
+def unpackbits(data: bytes) -> bytes:
+    """A decoder as a display would do it"""
+    out = bytearray()
+    pos = 0
+    while pos < len(data):
+        n = data[pos]
+        assert n != 128
+        if n < 128:
+            out += data[pos + 1:pos + n + 2]
+            pos += n + 2
+        else:
+            out += bytes([data[pos + 1]]) * (257 - n)
+            pos += 2
+    return bytes(out)
+
+
+def test_packbits_bytes():
+    # The example from Apple's PackBits technical note
+    data = bytes.fromhex('AAAAAA80002AAAAAAAAA80002A22AAAAAAAAAAAAAAAAAAAA')
+    assert packbits(data) == bytes.fromhex('FEAA0280002AFDAA0380002A22F7AA')
+
+
+@pytest.mark.parametrize('data,expected', [
+    (b'', b''),
+    (b'a', b'\x00a'),
+    # Pairs aren't worth a run
+    (b'aab', b'\x02aab'),
+    (b'aaab', b'\xfea\x00b'),
+    (b'a' * 128, b'\x81a'),
+    (b'a' * 129, b'\x81a\x00a'),
+    (b'a' * 130, b'\x81a\xffa'),
+    (bytes(range(130)), b'\x7f' + bytes(range(128)) + b'\x01\x80\x81'),
+])
+def test_packbits_limits(data, expected):
+    assert packbits(data) == expected
+
+
+def make_data():
+    rng = np.random.default_rng(1)
+    noise = rng.integers(0, 256, 1000, dtype=np.uint8).tobytes()
+    # Runs of every length around the limits, between literals
+    runs = b''.join(bytes([i % 256]) * n + b'xy' for i, n in enumerate(range(1, 300)))
+    # A mostly white 1 bit frame
+    frame = bytearray(b'\xff' * 5000)
+    frame[1000:1010] = b'\x00\x0f\xf0' * 3 + b'\x00'
+    return {'noise': noise, 'runs': runs, 'frame': bytes(frame), 'zeros': bytes(70000)}
+
+
+DATA = make_data()
+
+
+@pytest.mark.parametrize('name', DATA)
+def test_packbits_round_trip(name):
+    assert unpackbits(packbits(DATA[name])) == DATA[name]
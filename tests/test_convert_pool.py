@@ -0,0 +1,54 @@
+import io
+import os
+import sys
+from concurrent.futures.process import BrokenProcessPool
+
+import pytest
+from PIL import Image
+
+from app.lib import convert_pool as cp
+from app.lib.image import convert_colors, encode_image
+
+
+class App:
+    config = {'CONVERT_WORKERS': 1, 'CONVERT_SHM_MIN_SIZE': 1024}
+
+
+def make_png():
+    buf = io.BytesIO()
+    Image.effect_noise((64, 48), 60).convert('RGB').save(buf, 'PNG')
+    return buf.getvalue()
+
+
+@pytest.fixture
+def embedded(monkeypatch):
+    """sys.executable as it is under uWSGI, the uwsgi binary"""
+    monkeypatch.setattr(sys, 'executable', '/usr/bin/uwsgi')
+
+
+def test_python_executable_under_uwsgi(embedded):
+    path = cp.get_python_executable()
+    assert os.path.basename(path).startswith('python')
+    assert os.access(path, os.X_OK)
+
+
+def test_convert_under_uwsgi(embedded):
+    pool = cp.ConvertPool(App())
+    png = make_png()
+    try:
+        payload = pool.convert(png, None, '1b', 'floydsteinberg', 'BMP', timeout=60)
+    finally:
+        if pool.executor:
+            pool.executor.shutdown()
+    assert payload == encode_image(convert_colors(None, '1b', png), 'BMP')
+
+
+def test_start_error_is_broken_pool(monkeypatch):
+    def no_python():
+        raise RuntimeError("no interpreter")
+    monkeypatch.setattr(cp, 'get_python_executable', no_python)
+
+    pool = cp.ConvertPool(App())
+    with pytest.raises(BrokenProcessPool):
+        pool.convert(make_png(), None, '1b', 'floydsteinberg', 'BMP', timeout=60)
+    assert pool.executor is None
@@ -0,0 +1,185 @@
+import numpy as np
+import pytest
+from PIL import Image, ImageDraw
+
+from app.constants import COLOR_SPEC
+from app.lib.image import convert_palette, threshold_1bit, convert_colors, encode_raw, decode_raw, encode_image, decode_image
+
+
+# The conversion as it was before thresholding moved to numpy; the output
+# must stay byte-identical to it
+
+def baseline_threshold(in_im):
+    out_im = Image.new('1', in_im.size)
+    in_im = in_im.convert('L')
+    in_im = in_im.point(lambda p: 255 if p >= 170 else 0)
+    out_im.paste(in_im, tuple([0, 0] + list(in_im.size)))
+    return out_im
+
+
+def baseline_convert_colors(bit_depth, color_spec, in_im):
+    in_im = in_im.convert('RGB')
+    cs = COLOR_SPEC.get(color_spec, COLOR_SPEC['1b'])
+    if cs['bits'] == 1:
+        im = baseline_threshold(in_im)
+    elif cs['bits'] < 16:
+        im = Image.new('P', in_im.size)
+        im.putpalette(convert_palette(cs['palette']))
+        quantized = in_im.quantize(colors=len(cs['palette']), palette=im, dither=Image.Dither.FLOYDSTEINBERG)
+        im.paste(quantized, tuple([0, 0] + list(quantized.size)))
+    else:
+        im = Image.new('RGB', in_im.size)
+        im.paste(in_im.convert('RGB'), tuple([0, 0] + list(in_im.size)))
+
+    if bit_depth:
+        if bit_depth >= 16:
+            return im.convert('RGB')
+        return baseline_threshold(im)
+    return im
+
+
+def make_images():
+    rng = np.random.default_rng(1)
+    noise = Image.fromarray(rng.integers(0, 256, (97, 131, 3), dtype=np.uint8), 'RGB')
+
+    gradient = Image.new('RGB', (203, 61))
+    draw = ImageDraw.Draw(gradient)
+    for x in range(203):
+        draw.line((x, 0, x, 60), fill=(x, 255 - x, (x * 7) % 256))
+    draw.text((5, 5), "Hello 12", fill=(0, 0, 0))
+
+    # Right at the threshold, and widths that don't fill a whole byte
+    edge = Image.new('RGB', (8, 3), (170, 170, 170))
+    near_edge = Image.new('RGB', (9, 1), (169, 171, 169))
+    return {'noise': noise, 'gradient': gradient, 'edge': edge, 'near_edge': near_edge}
+
+
+IMAGES = make_images()
+
+
+@pytest.mark.parametrize('name', IMAGES)
+@pytest.mark.parametrize('mode', ['RGB', 'RGBA', 'L', 'P'])
+def test_threshold_1bit_matches_baseline(name, mode):
+    im = IMAGES[name].convert(mode)
+    expected = baseline_threshold(im)
+    actual = threshold_1bit(im)
+    assert actual.mode == '1'
+    assert actual.tobytes() == expected.tobytes()
+
+
+def test_threshold_1bit_keeps_1bit_images():
+    im = baseline_threshold(IMAGES['noise'])
+    assert threshold_1bit(im) is im
+
+
+@pytest.mark.parametrize('name', IMAGES)
+@pytest.mark.parametrize('color_spec', COLOR_SPEC)
+@pytest.mark.parametrize('bit_depth', [None, 1, 16, 24])
+def test_convert_colors_matches_baseline(name, color_spec, bit_depth):
+    expected = baseline_convert_colors(bit_depth, color_spec, IMAGES[name])
+    actual = convert_colors(bit_depth, color_spec, IMAGES[name].copy())
+    assert actual.mode == expected.mode
+    assert actual.tobytes() == expected.tobytes()
+    if expected.mode == 'P':
+        assert actual.getpalette() == expected.getpalette()
+
+
+# Converting in bands must give the same result as converting the whole image,
+# except for Floyd-Steinberg dithering to a palette, see convert_colors__banded
+
+@pytest.mark.parametrize('name', ['noise', 'gradient'])
+@pytest.mark.parametrize('color_spec', COLOR_SPEC)
+@pytest.mark.parametrize('bit_depth', [None, 1, 16])
+@pytest.mark.parametrize('dither', ['none', 'ordered'])
+@pytest.mark.parametrize('band_height', [8, 20, 32])
+def test_banded_matches_whole(name, color_spec, bit_depth, dither, band_height):
+    expected = convert_colors(bit_depth, color_spec, IMAGES[name].copy(), dither)
+    actual = convert_colors(bit_depth, color_spec, IMAGES[name].copy(), dither, band_height)
+    assert actual.mode == expected.mode
+    assert actual.tobytes() == expected.tobytes()
+    if expected.mode == 'P':
+        assert actual.getpalette() == expected.getpalette()
+
+
+@pytest.mark.parametrize('name', ['noise', 'gradient'])
+@pytest.mark.parametrize('band_height', [8, 20, 32])
+def test_banded_1bit_matches_whole(name, band_height):
+    expected = convert_colors(None, '1b', IMAGES[name].copy())
+    actual = convert_colors(None, '1b', IMAGES[name].copy(), 'floydsteinberg', band_height)
+    assert actual.tobytes() == expected.tobytes()
+
+
+# Raw formats, see encode_raw
+
+def make_palette_image(indexes, width):
+    im = Image.new('P', (width, len(indexes) // width))
+    im.putdata(indexes)
+    return im
+
+
+def test_raw_header():
+    im = Image.new('RGB', (300, 2))
+    assert encode_raw(im, 16)[:8] == b'FSR\x10\x2c\x01\x02\x00'
+
+
+def test_raw1_bytes():
+    # 9 pixels, the row is padded to two bytes
+    im = Image.new('1', (9, 1))
+    im.putdata([255, 0, 0, 255, 255, 255, 0, 0, 255])
+    assert encode_raw(im, 1) == b'FSR\x01\x09\x00\x01\x00' + bytes([0b10011100, 0b10000000])
+
+
+def test_raw2_bytes():
+    im = make_palette_image([0, 1, 2, 3, 3, 2], 6)
+    assert encode_raw(im, 2) == b'FSR\x02\x06\x00\x01\x00' + bytes([0b00011011, 0b11100000])
+
+
+def test_raw4_bytes():
+    im = make_palette_image([1, 15, 3, 0, 9, 4], 3)
+    assert encode_raw(im, 4)[8:] == bytes([0x1f, 0x30, 0x09, 0x40])
+
+
+def test_rgb565_bytes():
+    im = Image.new('RGB', (4, 1))
+    im.putdata([(255, 0, 0), (0, 255, 0), (0, 0, 255), (255, 255, 255)])
+    assert encode_raw(im, 16)[8:] == bytes([0x00, 0xf8, 0xe0, 0x07, 0x1f, 0x00, 0xff, 0xff])
+
+
+def test_raw_palette_too_big():
+    with pytest.raises(ValueError):
+        encode_raw(make_palette_image([0, 4], 2), 2)
+
+
+@pytest.mark.parametrize('name', IMAGES)
+def test_raw1_round_trip(name):
+    im = convert_colors(1, '1b', IMAGES[name].copy())
+    out = decode_image(encode_image(im, 'RAW1'))
+    assert out.mode == '1' and out.size == im.size
+    assert out.tobytes() == im.tobytes()
+
+
+@pytest.mark.parametrize('name', IMAGES)
+@pytest.mark.parametrize('fmt,color_spec', [('RAW4', '3b'), ('RAW4', '3b7')])
+def test_raw4_round_trip(name, fmt, color_spec):
+    im = convert_colors(None, color_spec, IMAGES[name].copy())
+    out = decode_image(encode_image(im, fmt))
+    assert out.mode == 'P' and out.size == im.size
+    # The palette isn't sent, only the indexes
+    assert out.tobytes() == im.tobytes()
+
+
+@pytest.mark.parametrize('name', IMAGES)
+def test_raw2_round_trip(name):
+    im = IMAGES[name].quantize(4)
+    out = decode_image(encode_image(im, 'RAW2'))
+    assert out.mode == 'P' and out.size == im.size
+    assert out.tobytes() == im.tobytes()
+
+
+@pytest.mark.parametrize('name', IMAGES)
+def test_rgb565_round_trip(name):
+    im = IMAGES[name]
+    out = decode_raw(encode_image(im, 'RGB565'))
+    expected = np.asarray(im) & np.array([0xf8, 0xfc, 0xf8], dtype=np.uint8)
+    assert out.size == im.size
+    assert np.array_equal(np.asarray(out), expected)
@@ -0,0 +1,68 @@
+import os
+import time
+
+import pytest
+
+from app.lib import limiter as limiter_module
+from app.lib.limiter import RenderLimiter
+
+
+class App:
+    def __init__(self, lock_dir):
+        self.config = {
+            'RENDER_LOCK_DIR': str(lock_dir),
+            'RENDER_CONCURRENCY': 1,
+            'RENDER_QUEUE_SIZE': 2,
+            'RENDER_QUEUE_TIMEOUT': 30,
+            'RENDER_RETRY_AFTER': 60,
+        }
+
+
+@pytest.fixture
+def limiter(tmp_path):
+    return RenderLimiter(App(tmp_path))
+
+
+def add_entry(limiter, pid, age=0):
+    path = os.path.join(limiter.queue_dir, f'{pid}-1-entry')
+    open(path, 'w').close()
+    if age:
+        mtime = time.time() - age
+        os.utime(path, (mtime, mtime))
+    return path
+
+
+def test_queued_own_process(limiter):
+    add_entry(limiter, os.getpid())
+    assert limiter._get_queued() == 1
+
+
+def test_queued_dead_process(limiter, monkeypatch):
+    def kill(pid, sig):
+        raise ProcessLookupError()
+    monkeypatch.setattr(limiter_module.os, 'kill', kill)
+
+    path = add_entry(limiter, 12345)
+    assert limiter._get_queued() == 0
+    assert not os.path.exists(path)
+
+
+def test_queued_other_users_process(limiter, monkeypatch):
+    def kill(pid, sig):
+        raise PermissionError()
+    monkeypatch.setattr(limiter_module.os, 'kill', kill)
+
+    path = add_entry(limiter, 12345)
+    assert limiter._get_queued() == 1
+    assert os.path.exists(path)
+
+
+def test_queued_reused_pid(limiter, monkeypatch):
+    def kill(pid, sig):
+        raise PermissionError()
+    monkeypatch.setattr(limiter_module.os, 'kill', kill)
+
+    # Much older than any waiter can be
+    path = add_entry(limiter, 12345, age=3600)
+    assert limiter._get_queued() == 0
+    assert not os.path.exists(path)
@@ -0,0 +1,19 @@
+from app import db
+from app.models import Display
+
+
+def sync(app, query):
+    with app.test_request_context('/display/render?' + query):
+        display = Display.sync()
+    db.session.expire_all()
+    return db.session.get(Display, display.id)
+
+
+def test_sync_unknown_dither(app):
+    display = sync(app, 'k=dither-bogus&ds=static&cs=1b&w=200&h=100&dt=bogus')
+    assert display.dither.code == 'floydsteinberg'
+
+
+def test_sync_dither(app):
+    display = sync(app, 'k=dither-ordered&ds=static&cs=1b&w=200&h=100&dt=ordered')
+    assert display.dither.code == 'ordered'
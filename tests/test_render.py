@@ -0,0 +1,72 @@
+import struct
+
+import pytest
+from PIL import Image, ImageDraw
+
+from app.constants import IMAGE_FORMAT
+from app.lib.image import encode_image, decode_image
+from app.lib.render import Frame, DeltaFrame, make_delta_frame
+
+
+def apply_delta(prev_im, payload: bytes):
+    """Apply a delta (see DeltaFrame) to the previous frame, as a display would"""
+    assert payload[:3] == b'FSD'
+    version, width, height, count = struct.unpack('<BHHH', payload[3:10])
+    assert version == 1 and (width, height) == prev_im.size
+    im = prev_im.copy()
+    pos = 10
+    for _ in range(count):
+        x, y, w, h, length = struct.unpack('<HHHHI', payload[pos:pos + 12])
+        pos += 12
+        rect_im = decode_image(payload[pos:pos + length])
+        assert rect_im.size == (w, h)
+        im.paste(rect_im, (x, y))
+        pos += length
+    assert pos == len(payload)
+    return im
+
+
+def test_no_delta_for_html_frames(app):
+    # Browser displays are sent HTML, but still have an image format set
+    prev_frame = Frame(b'<html><body>Old</body></html>', 'text/html')
+    frame = Frame(b'<html><body>New</body></html>', 'text/html')
+    assert make_delta_frame(prev_frame, frame, 'BMP') is None
+
+
+def test_delta_for_image_frames(app):
+    prev_im = Image.new('1', (64, 64), 1)
+    im = prev_im.copy()
+    im.putpixel((3, 5), 0)
+    prev_frame = Frame(encode_image(prev_im, 'BMP'), 'image/bmp')
+    frame = Frame(encode_image(im, 'BMP'), 'image/bmp')
+    delta = make_delta_frame(prev_frame, frame, 'BMP')
+    assert delta is not None
+    assert delta.etag == frame.etag
+
+
+def test_delta_frame_bytes():
+    frame = Frame(b'full', 'image/bmp')
+    delta = DeltaFrame(frame, (300, 200), [((8, 16, 24, 2), b'abc'), ((0, 40, 300, 8), b'')])
+    assert delta.payload == (
+        b'FSD\x01' + b'\x2c\x01' + b'\xc8\x00' + b'\x02\x00'
+        + b'\x08\x00\x10\x00\x18\x00\x02\x00' + b'\x03\x00\x00\x00' + b'abc'
+        + b'\x00\x00\x28\x00\x2c\x01\x08\x00' + b'\x00\x00\x00\x00'
+    )
+    assert delta.mimetype == 'application/x-fruitstand-delta'
+    assert delta.etag == frame.etag
+
+
+@pytest.mark.parametrize('fmt', ['BMP', 'RAW1'])
+def test_delta_round_trip(app, fmt):
+    prev_im = Image.new('1', (200, 120), 1)
+    im = prev_im.copy()
+    draw = ImageDraw.Draw(im)
+    draw.rectangle((10, 20, 40, 30), fill=0)
+    draw.text((100, 90), "12:34", fill=0)
+    prev_frame = Frame(encode_image(prev_im, fmt), IMAGE_FORMAT[fmt]['mimetype'])
+    frame = Frame(encode_image(im, fmt), IMAGE_FORMAT[fmt]['mimetype'])
+
+    delta = make_delta_frame(prev_frame, frame, fmt)
+    assert delta is not None
+    out = apply_delta(decode_image(prev_frame.payload).convert('1'), delta.payload)
+    assert out.tobytes() == im.tobytes()